@@ -3,26 +3,31 @@
 import numpy as np
 
 from skyllh.core.random import RandomStateService
-from skyllh.core.scrambling import DataScrambler, RAScramblingMethod
+from skyllh.core.scrambling import DataScrambler, UniformRAScramblingMethod
+from skyllh.core.storage import DataFieldRecordArray
 
-def gen_data(rss, N=100, window=(0,365)):
-    """Create uniformly distributed data on sphere. """
-    arr = np.empty((N,), dtype=[("ra", np.float), ("dec", np.float)])
+def gen_data(rss, N=100, window=(0,365), dtype=np.float64):
+    """Create uniformly distributed data on sphere. The ra and dec values are
+    drawn with a single call to the random number generator. Use
+    ``dtype=np.float32`` to halve the memory of the generated data.
+    """
+    raw = rss.random.uniform(size=(N, 2)).astype(dtype, copy=False)
+    raw[:,0] *= 2.*np.pi
+    raw[:,1] = raw[:,1]*2.*np.pi - np.pi
 
-    arr["ra"] = rss.random.uniform(0., 2.*np.pi, N)
-    arr["dec"] = rss.random.uniform(-np.pi, np.pi, N)
+    arr = raw.view(dtype=[("ra", dtype), ("dec", dtype)]).reshape((N,))
 
     return arr
 
 rss = RandomStateService(seed=1)
 
 # Generate some psydo data.
-data = gen_data(rss, N=10)
+data = DataFieldRecordArray(gen_data(rss, N=10), copy=False)
 print(data['ra'])
 
 # Create DataScrambler instance with RA scrambling.
-scr = DataScrambler(method=RAScramblingMethod(rss=rss))
+scr = DataScrambler(method=UniformRAScramblingMethod())
 
 # Scramble the data.
-scr.scramble_data(data)
+scr.scramble_data(rss, data)
 print(data['ra'])
@@ -56,14 +56,17 @@ def pointlikesource_to_data_field_array(
         raise TypeError('The sources of the SourceHypoGroupManager must be '
             'PointLikeSource instances!')
 
+    n_sources = len(sources)
     arr = np.empty(
-        (len(sources),),
-        dtype=[('ra', np.float), ('dec', np.float)],
+        (n_sources,),
+        dtype=[('ra', np.float64), ('dec', np.float64)],
         order='F')
 
-    for (i, src) in enumerate(sources):
-        arr['ra'][i] = src.ra
-        arr['dec'][i] = src.dec
+    # Stream the source locations directly into the pre-sized field arrays.
+    arr['ra'] = np.fromiter(
+        (src.ra for src in sources), dtype=np.float64, count=n_sources)
+    arr['dec'] = np.fromiter(
+        (src.dec for src in sources), dtype=np.float64, count=n_sources)
 
     return arr
 
@@ -1,18 +1,26 @@
 # -*- coding: utf-8 -*-
 
 import abc
+from collections import OrderedDict
 import numpy as np
+import weakref
 
 from skyllh.core.optimize import (
     AllEventSelectionMethod,
     EventSelectionMethod
 )
 from skyllh.core.py import (
+    NUMBA_LOADED,
     float_cast,
     func_has_n_args,
+    int_cast,
     issequenceof
 )
 from skyllh.core.debugging import get_logger
+from skyllh.core.random import (
+    AliasRandomChoice,
+    RandomChoice
+)
 from skyllh.core.scrambling import DataScrambler
 from skyllh.core.timing import TaskTimer
 from skyllh.core.config import CFG
@@ -89,10 +97,23 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
     mean number of background events and the probability of each monte-carlo
     event.
     """
+    # The names of the cache members, that depend on the DatasetData instance.
+    _DATA_CACHE_ATTR_NAMES = (
+        '_cache_mc_pre_selected',
+        '_cache_mc_event_bkg_prob',
+        '_cache_mc_event_bkg_prob_pre_selected',
+        '_cache_mean',
+        '_cache_mean_selected',
+        '_cache_p_binomial',
+        '_cache_random_choice',
+        '_cache_exp_field_names'
+    )
+
     def __init__(
         self, get_event_prob_func, get_mean_func=None, unique_events=False,
         data_scrambler=None, mc_inplace_scrambling=False,
-        keep_mc_data_fields=None, pre_event_selection_method=None):
+        keep_mc_data_fields=None, pre_event_selection_method=None,
+        data_cache_size=None):
         """Creates a new instance of the MCDataSamplingBkgGenMethod class.
 
         Parameters
@@ -139,6 +160,13 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
             pre-select the MC events that will be used for later background
             event generation. Using this pre-selection a large portion of the
             MC data can be reduced prior to background event generation.
+        data_cache_size : int | None
+            The number of DatasetData instances for which the cached MC
+            background event probabilities and mean numbers of background
+            events are kept. When generating background events for several
+            datasets alternately, this should be at least the number of
+            datasets. If set to None, the cache members are kept for all
+            DatasetData instances, as long as they exist. Default is None.
         """
         super(MCDataSamplingBkgGenMethod, self).__init__()
 
@@ -149,6 +177,7 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
         self.mc_inplace_scrambling = mc_inplace_scrambling
         self.keep_mc_data_field_names = keep_mc_data_fields
         self.pre_event_selection_method = pre_event_selection_method
+        self.data_cache_size = data_cache_size
 
         if((pre_event_selection_method is not None) and (get_mean_func is None)):
             raise ValueError('If an event pre-selection method is provided, a '
@@ -161,6 +190,18 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
         self._cache_mc_event_bkg_prob = None
         self._cache_mc_event_bkg_prob_pre_selected = None
         self._cache_mean = None
+        self._cache_mean_selected = None
+        self._cache_p_binomial = None
+        self._cache_random_choice = None
+        self._cache_exp_field_names = None
+
+        # The dictionary holding the cache members for the most recently used
+        # DatasetData instances. The key is the id of the DatasetData instance
+        # and the value is a 2-element tuple with a weak reference to the
+        # DatasetData instance and a dictionary with the values of the cache
+        # members. The weak reference detects a reused id of a deleted
+        # DatasetData instance, without keeping the instance alive.
+        self._data_cache_dict = OrderedDict()
 
     @property
     def get_event_prob_func(self):
@@ -276,6 +317,23 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
                 method = None
         self._pre_event_selection_method = method
 
+    @property
+    def data_cache_size(self):
+        """The number of DatasetData instances for which the cached MC
+        background event probabilities and mean numbers of background events
+        are kept. None means, the cache members are kept for all existing
+        DatasetData instances.
+        """
+        return self._data_cache_size
+    @data_cache_size.setter
+    def data_cache_size(self, n):
+        n = int_cast(n, 'The data_cache_size property must be None, or '
+            'castable to type int!', allow_None=True)
+        if((n is not None) and (n < 1)):
+            raise ValueError('The data_cache_size property must be at least '
+                '1!')
+        self._data_cache_size = n
+
     def change_source_hypo_group_manager(self, src_hypo_group_manager):
         """Changes the SourceHypoGroupManager instance of the
         pre-event-selection method. Also it invalides the data cache of this
@@ -292,6 +350,212 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
 
         # Invalidate the data cache.
         self._cache_data_id = None
+        self._data_cache_dict.clear()
+
+    def _update_cache(self, dataset, data, tl=None):
+        """Updates the cached MC background event probabilities and mean
+        numbers of background events, if the given data differs from the data
+        of the current cache.
+
+        Parameters
+        ----------
+        dataset : instance of Dataset
+            The Dataset instance describing the dataset for which background
+            events should get generated.
+        data : instance of DatasetData
+            The DatasetData instance holding the data of the dataset for which
+            background events should get generated.
+        tl : instance of TimeLord | None
+            The optional instance of TimeLord that should be used to collect
+            timing information about this method.
+        """
+        # Check if the data set has changed. In that case need to get new
+        # background probabilities for each monte-carlo event and a new mean
+        # number of background events.
+        data_id = id(data)
+        cache_entry = self._data_cache_dict.get(data_id, None)
+        if((cache_entry is not None) and (cache_entry[0]() is not data)):
+            # The DatasetData instance of the cache entry got deleted and its
+            # id got reused by the given DatasetData instance.
+            del self._data_cache_dict[data_id]
+            cache_entry = None
+            self._cache_data_id = None
+        if(self._cache_data_id == data_id):
+            return
+
+        if(CFG['debugging']['enable_tracing']):
+            logger.debug(
+                'DatasetData instance id of dataset "%s" changed from %s to '
+                '%s', dataset.name, self._cache_data_id, data_id)
+        # Cache the current id of the data.
+        self._cache_data_id = data_id
+
+        # Restore the cache members, if the data was used recently.
+        if(cache_entry is not None):
+            self._data_cache_dict.move_to_end(data_id)
+            for (name, value) in cache_entry[1].items():
+                setattr(self, name, value)
+            return
+
+        # Cache the list of experimental data fields. It is defined as the
+        # unique set of the required experimental data fields defined by the
+        # data set, and the actual experimental data fields (in case there are
+        # additional kept data fields by the user).
+        self._cache_exp_field_names = list(set(
+            CFG['dataset']['analysis_required_exp_field_names'] +
+            data.exp_field_names
+        ))
+
+        # Create a copy of the MC data with all MC data fields removed,
+        # except the specified MC data fields to keep for the
+        # ``get_mean_func`` and ``get_event_prob_func`` functions.
+        keep_field_names = list(set(
+            self._cache_exp_field_names +
+            self._keep_mc_data_field_names
+        ))
+        data_mc = data.mc.copy(keep_fields=keep_field_names)
+
+        if(self._get_mean_func is not None):
+            with TaskTimer(tl, 'Calculate total MC background mean.'):
+                self._cache_mean = self._get_mean_func(
+                    dataset, data, data_mc)
+
+        with TaskTimer(tl, 'Calculate MC background event probability cache.'):
+            self._cache_mc_event_bkg_prob = self._get_event_prob_func(
+                dataset, data, data_mc)
+
+        if(self._pre_event_selection_method is not None):
+            with TaskTimer(tl, 'Pre-select MC events.'):
+                (self._cache_mc_pre_selected,
+                 mc_pre_selected_mask_idxs) =\
+                self._pre_event_selection_method.select_events(
+                    data_mc, retidxs=True, tl=tl)
+            with TaskTimer(tl, 'Calculate selected MC background mean.'):
+                self._cache_mean_selected = self._get_mean_func(
+                    dataset, data, self._cache_mc_pre_selected)
+            # The fraction of background events, which fall into the
+            # pre-selected MC events. It is used to normalize the background
+            # probabilities of the pre-selected MC events to unity.
+            self._cache_p_binomial = (
+                self._cache_mean_selected / self._cache_mean)
+            self._cache_mc_event_bkg_prob_pre_selected = (
+                self._cache_mc_event_bkg_prob[mc_pre_selected_mask_idxs] /
+                self._cache_p_binomial)
+        else:
+            self._cache_mc_pre_selected = data_mc
+            self._cache_p_binomial = 1.
+
+        # Remove the MC specific data fields from the pre-selected MC events,
+        # which were needed only to calculate the background probabilities and
+        # means above. So the drawn background events contain only
+        # experimental data fields and need no further tidy up for each trial.
+        with TaskTimer(tl, 'Remove MC specific data fields from MC events.'):
+            self._cache_mc_pre_selected.tidy_up(self._cache_exp_field_names)
+
+        # Create the random choice instance for drawing MC events with
+        # replacement. With numba it builds the alias tables of the MC
+        # background event probabilities only once for all trials, and then
+        # draws each event in constant time. Without numba building the alias
+        # tables is slow, so the CDF of the probabilities is used instead.
+        random_choice_cls = (
+            AliasRandomChoice if NUMBA_LOADED else RandomChoice)
+        with TaskTimer(tl, 'Create MC background event random choice.'):
+            self._cache_random_choice = random_choice_cls(
+                items=self._cache_mc_pre_selected.indices,
+                probabilities=(
+                    self._cache_mc_event_bkg_prob
+                    if self._pre_event_selection_method is None else
+                    self._cache_mc_event_bkg_prob_pre_selected))
+
+        # Store the cache members for the data, and drop the cache members of
+        # deleted data and of the least recently used data, if the cache is
+        # full.
+        self._data_cache_dict[data_id] = (weakref.ref(data), dict([
+            (name, getattr(self, name))
+            for name in self._DATA_CACHE_ATTR_NAMES
+        ]))
+        for (key, (data_ref, _)) in list(self._data_cache_dict.items()):
+            if(data_ref() is None):
+                del self._data_cache_dict[key]
+        if(self._data_cache_size is not None):
+            while(len(self._data_cache_dict) > self._data_cache_size):
+                self._data_cache_dict.popitem(last=False)
+
+    def _get_mean_and_p(self, mean):
+        """Gets the mean number of background events, the fraction of
+        background events of the pre-selected MC events, and the background
+        probabilities of the pre-selected MC events. The cache must be up to
+        date.
+
+        Parameters
+        ----------
+        mean : float | None
+            The mean number of background events to generate.
+            Can be `None`. In that case the cached mean number of background
+            events is used.
+
+        Returns
+        -------
+        mean : float
+            The mean number of background events.
+        p_binomial : float
+            The fraction of background events, which fall into the
+            pre-selected MC events.
+        p : 1d ndarray
+            The background probabilities of the pre-selected MC events.
+        """
+        if(mean is None):
+            if(self._cache_mean is None):
+                raise ValueError('No mean number of background events and no '
+                    'get_mean_func were specified! One of the two must be '
+                    'specified!')
+            mean = self._cache_mean
+        else:
+            mean = float_cast(mean, 'The mean number of background events must '
+                'be castable to type float!')
+
+        # Get the fraction of background events, which fall into the
+        # pre-selected MC events, and the background probabilities of the
+        # pre-selected MC events. Both are cached, because they depend only on
+        # the data.
+        p_binomial = self._cache_p_binomial
+        if(self._pre_event_selection_method is None):
+            p = self._cache_mc_event_bkg_prob
+        else:
+            p = self._cache_mc_event_bkg_prob_pre_selected
+
+        return (mean, p_binomial, p)
+
+    def _create_bkg_events(self, rss, bkg_event_indices, tl=None):
+        """Creates the background events from the given indices of the
+        pre-selected MC events. The events get scrambled if requested.
+
+        Parameters
+        ----------
+        rss : instance of RandomStateService
+            The instance of RandomStateService that should be used to generate
+            random numbers from.
+        bkg_event_indices : 1d ndarray of int
+            The indices of the drawn pre-selected MC events.
+        tl : instance of TimeLord | None
+            The optional instance of TimeLord that should be used to collect
+            timing information about this method.
+
+        Returns
+        -------
+        bkg_events : instance of DataFieldRecordArray
+            The instance of DataFieldRecordArray holding the background events.
+        """
+        with TaskTimer(tl, 'Select MC background events from indices.'):
+            bkg_events = self._cache_mc_pre_selected[bkg_event_indices]
+
+        # Scramble the drawn MC events if requested.
+        if(self._data_scrambler is not None):
+            with TaskTimer(tl, 'Scramble MC background data.'):
+                bkg_events = self._data_scrambler.scramble_data(
+                    rss, bkg_events, copy=False)
+
+        return bkg_events
 
     def generate_events(
             self, rss, dataset, data, mean=None, poisson=True, tl=None):
@@ -313,6 +577,17 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
             The mean number of background events to generate.
             Can be `None`. In that case the mean number of background events is
             obtained through the `get_mean_func` function.
+
+            .. note::
+
+                If a pre-selection method is set, the fraction of background
+                events, which fall into the pre-selected MC events, is the
+                ratio of the means obtained through the `get_mean_func`
+                function for the pre-selected and for all MC events. This
+                fraction is applied to the number of background events, also
+                if a mean is given. The probabilities of the pre-selected MC
+                events are normalized with this fraction, so they sum up to
+                unity.
         poisson : bool
             If set to True (default), the actual number of generated background
             events will be drawn from a Poisson distribution with the given mean
@@ -332,120 +607,124 @@ class MCDataSamplingBkgGenMethod(BackgroundGenerationMethod):
             background events. The number of events can be less than `n_bkg`
             if an event selection method is used.
         """
-        tracing_enabled = CFG['debugging']['enable_tracing']
-
-        # Create aliases to avoid dot-lookup.
-        self__pre_event_selection_method = self._pre_event_selection_method
-
-        # Check if the data set has changed. In that case need to get new
-        # background probabilities for each monte-carlo event and a new mean
-        # number of background events.
-        data_id = id(data)
-        if(self._cache_data_id != data_id):
-            if(tracing_enabled):
-                logger.debug(
-                    f'DatasetData instance id of dataset "{dataset.name}" '
-                    f'changed from {self._cache_data_id} to {data_id}')
-            # Cache the current id of the data.
-            self._cache_data_id = data_id
-
-            # Create a copy of the MC data with all MC data fields removed,
-            # except the specified MC data fields to keep for the
-            # ``get_mean_func`` and ``get_event_prob_func`` functions.
-            keep_field_names = list(set(
-                CFG['dataset']['analysis_required_exp_field_names'] +
-                data.exp_field_names +
-                self._keep_mc_data_field_names
-            ))
-            data_mc = data.mc.copy(keep_fields=keep_field_names)
-
-            if(self._get_mean_func is not None):
-                with TaskTimer(tl, 'Calculate total MC background mean.'):
-                    self._cache_mean = self._get_mean_func(
-                        dataset, data, data_mc)
-
-            with TaskTimer(tl, 'Calculate MC background event probability cache.'):
-                self._cache_mc_event_bkg_prob = self._get_event_prob_func(
-                    dataset, data, data_mc)
-
-            if(self__pre_event_selection_method is not None):
-                with TaskTimer(tl, 'Pre-select MC events.'):
-                    (self._cache_mc_pre_selected,
-                     mc_pre_selected_mask_idxs) =\
-                    self__pre_event_selection_method.select_events(
-                        data_mc, retidxs=True, tl=tl)
-                self._cache_mc_event_bkg_prob_pre_selected = self._cache_mc_event_bkg_prob[mc_pre_selected_mask_idxs]
-            else:
-                self._cache_mc_pre_selected = data_mc
+        self._update_cache(dataset, data, tl=tl)
 
-
-        if(mean is None):
-            if(self._cache_mean is None):
-                raise ValueError('No mean number of background events and no '
-                    'get_mean_func were specified! One of the two must be '
-                    'specified!')
-            mean = self._cache_mean
-        else:
-            mean = float_cast(mean, 'The mean number of background events must '
-                'be castable to type float!')
+        (mean, p_binomial, p) = self._get_mean_and_p(mean)
 
         # Draw the number of background events from a poisson distribution with
         # the given mean number of background events. This will be the number of
         # background events for this data set.
+        # Note: The Python built-in round function rounds half to even like
+        #       np.round, but without creating a numpy scalar.
         n_bkg = (int(rss.random.poisson(mean)) if poisson else
-                 int(np.round(mean, 0)))
-
-        # Apply only event pre-selection before choosing events.
-        data_mc_selected = self._cache_mc_pre_selected
-
-        # Calculate the mean number of background events for the pre-selected
-        # MC events.
-        if(self__pre_event_selection_method is None):
-            # No selection at all, use the total mean.
-            mean_selected = mean
-        else:
-            with TaskTimer(tl, 'Calculate selected MC background mean.'):
-                mean_selected = self._get_mean_func(
-                    dataset, data, data_mc_selected)
+                 int(round(mean)))
 
         # Calculate the actual number of background events for the selected
         # events.
-        p_binomial = mean_selected / mean
-        with TaskTimer(tl, 'Get p array.'):
-            if(self__pre_event_selection_method is None):
-                p = self._cache_mc_event_bkg_prob
-            else:
-                # Pre-selection.
-                p = self._cache_mc_event_bkg_prob_pre_selected / p_binomial
-        n_bkg_selected = int(np.around(n_bkg * p_binomial, 0))
+        n_bkg_selected = int(round(n_bkg * p_binomial))
 
         # Draw the actual background events from the selected events of the
         # monto-carlo data set.
         with TaskTimer(tl, 'Draw MC background indices.'):
-            bkg_event_indices = rss.random.choice(
-                data_mc_selected.indices,
-                size=n_bkg_selected,
-                p=p,
-                replace=(not self._unique_events))
-        with TaskTimer(tl, 'Select MC background events from indices.'):
-            bkg_events = data_mc_selected[bkg_event_indices]
-
-        # Scramble the drawn MC events if requested.
-        if(self._data_scrambler is not None):
-            with TaskTimer(tl, 'Scramble MC background data.'):
-                bkg_events = self._data_scrambler.scramble_data(
-                    rss, bkg_events, copy=False)
+            if(self._unique_events):
+                bkg_event_indices = rss.random.choice(
+                    self._cache_mc_pre_selected.indices,
+                    size=n_bkg_selected,
+                    p=p,
+                    replace=False)
+            else:
+                bkg_event_indices = self._cache_random_choice(
+                    rss, n_bkg_selected)
 
-        # Remove MC specific data fields from the background events record
-        # array. So the result contains only experimental data fields. The list
-        # of experimental data fields is defined as the unique set of the
-        # required experimental data fields defined by the data set, and the
-        # actual experimental data fields (in case there are additional kept
-        # data fields by the user).
-        with TaskTimer(tl, 'Remove MC specific data fields from MC events.'):
-            exp_field_names = list(set(
-                CFG['dataset']['analysis_required_exp_field_names'] +
-                data.exp_field_names))
-            bkg_events.tidy_up(exp_field_names)
+        bkg_events = self._create_bkg_events(
+            rss, bkg_event_indices, tl=tl)
 
         return (n_bkg, bkg_events)
+
+    def generate_events_batch(
+            self, rss, dataset, data, n_trials, mean=None, poisson=True,
+            tl=None):
+        """Generates background events for ``n_trials`` trials at once for
+        the given dataset and its data. The numbers of background events and
+        the MC event indices of all trials are drawn with single vectorized
+        calls. Hence, the generated events differ from the ones of
+        ``n_trials`` successive ``generate_events`` calls with the same random
+        state.
+
+        Parameters
+        ----------
+        rss : instance of RandomStateService
+            The instance of RandomStateService that should be used to generate
+            random numbers from.
+        dataset : instance of Dataset
+            The Dataset instance describing the dataset for which background
+            events should get generated.
+        data : instance of DatasetData
+            The DatasetData instance holding the data of the dataset for which
+            background events should get generated.
+        n_trials : int
+            The number of trials for which background events should get
+            generated.
+        mean : float | None
+            The mean number of background events to generate per trial.
+            Can be `None`. In that case the mean number of background events is
+            obtained through the `get_mean_func` function.
+        poisson : bool
+            If set to True (default), the actual number of generated background
+            events of each trial will be drawn from a Poisson distribution with
+            the given mean value of background events.
+            If set to False, the argument ``mean`` specifies the actual number
+            of generated background events.
+        tl : instance of TimeLord | None
+            The optional instance of TimeLord that should be used to collect
+            timing information about this method.
+
+        Returns
+        -------
+        result_list : list of (n_bkg, bkg_events) tuples
+            The list of length ``n_trials`` holding the number of generated
+            background events and the DataFieldRecordArray instance holding
+            the generated background events for each trial. See the
+            ``generate_events`` method for a description of the two tuple
+            elements.
+        """
+        n_trials = int_cast(n_trials, 'The n_trials argument must be castable '
+            'to type int!')
+        if(n_trials < 0):
+            raise ValueError('The n_trials argument must not be negative!')
+
+        self._update_cache(dataset, data, tl=tl)
+
+        (mean, p_binomial, p) = self._get_mean_and_p(mean)
+
+        # Draw the numbers of background events for all trials at once.
+        if(poisson):
+            n_bkg_arr = rss.random.poisson(mean, size=n_trials)
+        else:
+            n_bkg_arr = np.full((n_trials,), int(round(mean)))
+        n_bkg_selected_arr = np.around(n_bkg_arr * p_binomial, 0).astype(
+            np.int64)
+
+        # Draw the MC event indices for all trials at once and split them into
+        # the individual trials.
+        with TaskTimer(tl, 'Draw MC background indices.'):
+            if(self._unique_events):
+                mc_indices = self._cache_mc_pre_selected.indices
+                bkg_event_indices_list = [
+                    rss.random.choice(mc_indices, size=n, p=p, replace=False)
+                    for n in n_bkg_selected_arr
+                ]
+            else:
+                bkg_event_indices_list = np.split(
+                    self._cache_random_choice(
+                        rss, np.sum(n_bkg_selected_arr)),
+                    np.cumsum(n_bkg_selected_arr)[:-1])
+
+        result_list = [
+            (int(n_bkg), self._create_bkg_events(
+                rss, bkg_event_indices, tl=tl))
+            for (n_bkg, bkg_event_indices) in zip(
+                n_bkg_arr, bkg_event_indices_list)
+        ]
+
+        return result_list
@@ -61,6 +61,10 @@ class BinningDefinition(object):
     def binedges(self, arr):
         arr = np.atleast_1d(arr)
         self._binedges = np.array(arr, dtype=np.float64)
+        self._bincenters = 0.5*(self._binedges[:-1] + self._binedges[1:])
+        # The bin centers are shared with every caller, so protect them
+        # against in-place modifications.
+        self._bincenters.setflags(write=False)
 
     @property
     def nbins(self):
@@ -70,9 +74,10 @@ class BinningDefinition(object):
 
     @property
     def bincenters(self):
-        """The center values of the bins.
+        """The center values of the bins. They are computed once, whenever the
+        bin edges are set, and are read-only.
         """
-        return 0.5*(self._binedges[:-1] + self._binedges[1:])
+        return self._bincenters
 
     @property
     def lower_edge(self):
@@ -34,7 +34,21 @@ _BASECONFIG = {
             '%(message)s'),
         # Flag if detailed debug log messages, i.e. trace log messages, should
         # get generated. This is good for debugging but bad for performance.
-        'enable_tracing': False
+        'enable_tracing': False,
+        # Flag if the types of the arguments of frequently called setup
+        # methods, e.g. PDFSet.add_pdf, should get checked. Disabling the
+        # checks saves some time when building large PDF sets from trusted
+        # code.
+        'enable_type_checks': True
+    },
+    'numba': {
+        # Flag if PDF classes should calculate their PDF values via numba
+        # compiled ufuncs, when numba is available. The ufuncs run in parallel
+        # on all CPU cores. On a single CPU core the numpy implementation is
+        # faster, and within the worker processes of multi-processing
+        # functions, e.g. Analysis.do_trials, the ufuncs would oversubscribe
+        # the CPU cores. Hence, the ufuncs need to be enabled explicitly.
+        'enable_pdf_ufuncs': False
     },
     'project': {
         # The project's working directory.
@@ -144,8 +144,7 @@ class LLHRatio(object, metaclass=abc.ABCMeta):
             with TaskTimer(tl, 'Evaluate llh-ratio function.'):
                 (f, grads) = self_evaluate(fitparam_values, tl=tl)
                 if(tracing): logger.debug(
-                    'LLH-ratio func value f={:g}, grads={}'.format(
-                        f, str(grads)))
+                    'LLH-ratio func value f=%g, grads=%s', f, grads)
             return (-f, -grads)
 
         minimize_kwargs = {'func_provides_grads': True}
@@ -474,9 +473,7 @@ class ZeroSigH0SingleDatasetTCLLHRatio(SingleDatasetTCLLHRatio):
         Nprime = len(Xi)
 
         if(tracing):
-            logger.debug(
-                'N={:d}, Nprime={:d}'.format(
-                    N, Nprime))
+            logger.debug('N=%d, Nprime=%d', N, Nprime)
 
         one_plus_alpha = ZeroSigH0SingleDatasetTCLLHRatio._one_plus_alpha
 
@@ -490,8 +487,7 @@ class ZeroSigH0SingleDatasetTCLLHRatio(SingleDatasetTCLLHRatio):
         if(tracing):
             logger.debug(
                 '# of events doing Taylor expansion for (unstable events): '
-                '{:d}'.format(
-                    np.count_nonzero(unstablemask)))
+                '%d', np.count_nonzero(unstablemask))
 
         # Allocate memory for the log_lambda_i values.
         log_lambda_i = np.empty_like(alpha_i, dtype=np.float)
@@ -690,7 +686,7 @@ class SingleSourceZeroSigH0SingleDatasetTCLLHRatio(
         # Calculate Xi for each (selected) event.
         Xi = (Ri - 1.) / N
         if(tracing):
-            logger.debug('dtype(Xi)={:s}'.format(str(Xi.dtype)))
+            logger.debug('dtype(Xi)=%s', Xi.dtype)
 
         # Calculate the gradients of Xi for each fit parameter (without ns).
         dXi_ps = np.empty((len(fitparam_values)-1,len(Xi)), dtype=np.float)
@@ -707,8 +703,8 @@ class SingleSourceZeroSigH0SingleDatasetTCLLHRatio(
 
         if(tracing):
             logger.debug(
-                '{:s}.evaluate: N={:d}, Nprime={:d}, ns={:.3f}, '.format(
-                    classname(self), N, len(Xi), ns))
+                '%s.evaluate: N=%d, Nprime=%d, ns=%.3f, ',
+                classname(self), N, len(Xi), ns)
 
         with TaskTimer(tl, 'Calc logLamds and grads'):
             (log_lambda, grads) = self.calculate_log_lambda_and_grads(
@@ -1141,8 +1137,7 @@ class MultiDatasetTCLLHRatio(TCLLHRatio):
         ns = fitparam_values[0]
         if(tracing):
             logger.debug(
-                '{:s}.evaluate: ns={:.3f}'.format(
-                    classname(self), ns))
+                '%s.evaluate: ns=%.3f', classname(self), ns)
 
         # Get the dataset signal weights and their gradients.
         # f is a (N_datasets,)-shaped 1D ndarray.
@@ -1173,9 +1168,7 @@ class MultiDatasetTCLLHRatio(TCLLHRatio):
         # Loop over the llh ratio functions.
         for (j, llhratio) in enumerate(self._llhratio_list):
             if(tracing):
-                logger.debug(
-                    'nsf[j={:d}] = {:.3f}'.format(
-                        j, nsf[j]))
+                logger.debug('nsf[j=%d] = %.3f', j, nsf[j])
             llhratio_fitparam_values[0] = nsf[j]
             llhratio_fitparam_values[1:] = fitparam_values[1:]
             (log_lambda_j, grads_j) = llhratio.evaluate(
@@ -206,14 +206,18 @@ class SpatialEventSelectionMethod(EventSelectionMethod, metaclass=abc.ABCMeta):
             raise TypeError('The sources argument must be a sequence of '
                 'SourceModel instances!')
 
+        n_sources = len(sources)
         arr = np.empty(
-            (len(sources),),
-            dtype=[('ra', np.float), ('dec', np.float)],
+            (n_sources,),
+            dtype=[('ra', np.float64), ('dec', np.float64)],
             order='F')
 
-        for (i, src) in enumerate(sources):
-            arr['ra'][i] = src.loc.ra
-            arr['dec'][i] = src.loc.dec
+        # Stream the source locations directly into the pre-sized field
+        # arrays.
+        arr['ra'] = np.fromiter(
+            (src.loc.ra for src in sources), dtype=np.float64, count=n_sources)
+        arr['dec'] = np.fromiter(
+            (src.loc.dec for src in sources), dtype=np.float64, count=n_sources)
 
         return arr
 
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
 from skyllh.core.binning import BinningDefinition
+from skyllh.core.config import CFG
 from skyllh.core.interpolate import (
     GridManifoldInterpolationMethod,
     Linear1DGridManifoldInterpolationMethod
 )
 from skyllh.core.py import (
+    NUMBA_LOADED,
     ObjectCollection,
     classname,
     func_has_n_args,
@@ -16,8 +18,7 @@ from skyllh.core.debugging import get_logger
 from skyllh.core.parameters import (
     ParameterGrid,
     ParameterGridSet,
-    ParameterSet,
-    make_params_hash
+    ParameterSet
 )
 from skyllh.core.timing import TaskTimer
 from skyllh.core.trialdata import TrialDataManager
@@ -35,10 +36,51 @@ try:
 except ImportError:
     PHOTOSPLINE_LOADED = False
 
+if(NUMBA_LOADED):
+    import numba
+
 
 logger = get_logger(__name__)
 
 
+def make_pdf_ufunc(scalar_func, signatures):
+    """Creates a numpy ufunc from the given scalar function, which calculates
+    the PDF value for a single event. The ufunc broadcasts its arguments like
+    any other numpy ufunc.
+
+    If numba is available, the ufunc is compiled via ``numba.vectorize`` for
+    the ``parallel`` target, i.e. the PDF values are calculated on all CPU
+    cores. The compiled ufunc is cached on disk, so the compilation happens
+    only once and not in every new Python process. Otherwise
+    ``numpy.vectorize`` is used, which calls the scalar function in a Python
+    loop. Hence, PDF classes should only use the ufunc
+    when ``NUMBA_LOADED`` is ``True``.
+
+    On a single CPU core the parallel ufunc is slower than the equivalent
+    numpy array expressions. Thus, PDF classes should use the ufunc only if
+    the ``CFG['numba']['enable_pdf_ufuncs']`` setting is enabled.
+
+    Parameters
+    ----------
+    scalar_func : callable
+        The scalar function calculating the PDF value. It must be compilable
+        by numba in nopython mode.
+    signatures : list of str
+        The list of numba signatures the ufunc should get compiled for, e.g.
+        ``['f8(f8)', 'f4(f4)']``.
+
+    Returns
+    -------
+    ufunc : callable
+        The ufunc for the given scalar function.
+    """
+    if(NUMBA_LOADED):
+        return numba.vectorize(
+            signatures, target='parallel', cache=True)(scalar_func)
+
+    return np.vectorize(scalar_func)
+
+
 class PDFAxis(object):
     """This class describes an axis of a PDF. It's main purpose is to define
     the allowed variable space of the PDF. So this information can be used to
@@ -1227,6 +1269,11 @@ class PDFSet(object):
             raise TypeError('The fitparams_grid_set property must be an object '
                             'of type ParameterGridSet!')
         self._fitparams_grid_set = obj
+        # Invalidate the cached list of grid fit parameter permutations and
+        # their PDF keys.
+        self._gridfitparams_list = None
+        self._gridfitparams_keys = None
+        self._pdf_list = None
 
     @property
     def param_grid_set(self):
@@ -1234,10 +1281,28 @@ class PDFSet(object):
 
     @property
     def gridfitparams_list(self):
-        """(read-only) The list of dictionaries of all the fit parameter
-        permutations on the grid.
+        """(read-only) The tuple of dictionaries of all the fit parameter
+        permutations on the grid. The permutations are created only once and
+        cached until a new fit parameter grid set is set.
+        """
+        if(self._gridfitparams_list is None):
+            self._gridfitparams_list = tuple(
+                self._fitparams_grid_set.parameter_permutation_dict_list)
+        return self._gridfitparams_list
+
+    @property
+    def gridfitparams_keys(self):
+        """(read-only) The tuple of the PDF keys of all the fit parameter
+        permutations on the grid, in the same order as ``gridfitparams_list``.
+        The keys are created only once and cached until a new fit parameter
+        grid set is set.
         """
-        return self._fitparams_grid_set.parameter_permutation_dict_list
+        if(self._gridfitparams_keys is None):
+            self._gridfitparams_keys = tuple([
+                self._make_pdf_key(gridfitparams)
+                for gridfitparams in self.gridfitparams_list
+            ])
+        return self._gridfitparams_keys
 
     @property
     def pdf_keys(self):
@@ -1253,6 +1318,15 @@ class PDFSet(object):
         key = next(iter(self._gridfitparams_hash_pdf_dict.keys()))
         return self._gridfitparams_hash_pdf_dict[key].axes
 
+    @staticmethod
+    def _make_pdf_key(gridfitparams):
+        """Creates the key of the internal PDF registry for the given grid fit
+        parameter dictionary. The key is the tuple of the sorted dictionary
+        items, so it is independent of the insertion order of the dictionary
+        and can be used directly as dictionary key.
+        """
+        return tuple(sorted(gridfitparams.items()))
+
     def items(self):
         """Returns the list of 2-element tuples for the PDF stored in this
         PDFSet object.
@@ -1277,19 +1351,22 @@ class PDFSet(object):
         KeyError
             If the given PDF was already added for the given set of parameters.
         TypeError
-            If any of the method's arguments has the wrong type.
+            If any of the method's arguments has the wrong type. The argument
+            types are only checked if the
+            ``CFG['debugging']['enable_type_checks']`` setting is ``True``.
         ValueError
             If the axes of the given PDFs are not the same as the axes of the
             already added PDFs.
         """
-        if(not isinstance(pdf, self.pdf_type)):
-            raise TypeError('The pdf argument must be an instance of %s!' % (
-                typename(self.pdf_type)))
-        if(not isinstance(gridfitparams, dict)):
-            raise TypeError('The fitparams argument must be of type dict!')
-
-        gridfitparams_hash = make_params_hash(gridfitparams)
-        if(gridfitparams_hash in self._gridfitparams_hash_pdf_dict):
+        if(CFG['debugging']['enable_type_checks']):
+            if(not isinstance(pdf, self._pdf_type)):
+                raise TypeError('The pdf argument must be an instance of %s!' % (
+                    typename(self._pdf_type)))
+            if(not isinstance(gridfitparams, dict)):
+                raise TypeError('The fitparams argument must be of type dict!')
+
+        gridfitparams_key = self._make_pdf_key(gridfitparams)
+        if(gridfitparams_key in self._gridfitparams_hash_pdf_dict):
             raise KeyError('The PDF with grid fit parameters %s was already '
                            'added!' % (str(gridfitparams)))
 
@@ -1306,17 +1383,32 @@ class PDFSet(object):
                         str(pdf.axes), str(some_pdf.axes))
                     )
 
-        self._gridfitparams_hash_pdf_dict[gridfitparams_hash] = pdf
+        self._gridfitparams_hash_pdf_dict[gridfitparams_key] = pdf
+
+        # The index based PDF list is out of date now.
+        self._pdf_list = None
+
+    def finalize(self):
+        """Creates the list of the PDF objects ordered by the index of their
+        fit parameter permutation within the ``gridfitparams_list`` property.
+        This method should be called after all PDF objects have been added.
+        Afterwards the ``get_pdf_by_index`` method retrieves the PDF objects
+        via plain list indexing. Adding a PDF object invalidates the list.
+        """
+        pdf_dict = self._gridfitparams_hash_pdf_dict
+        self._pdf_list = [
+            pdf_dict.get(key) for key in self.gridfitparams_keys
+        ]
 
     def get_pdf(self, gridfitparams):
         """Retrieves the PDF object for the given set of fit parameters.
 
         Parameters
         ----------
-        gridfitparams : dict | int
+        gridfitparams : dict | tuple
             The dictionary with the grid fit parameters for which the PDF object
-            should get retrieved. If an integer is given, it is assumed to be
-            the PDF key.
+            should get retrieved. If a tuple is given, it is assumed to be
+            the PDF key as returned by the ``pdf_keys`` property.
 
         Returns
         -------
@@ -1328,19 +1420,52 @@ class PDFSet(object):
         KeyError
             If no PDF object was created for the given set of parameters.
         """
-        if(isinstance(gridfitparams, int)):
-            gridfitparams_hash = gridfitparams
-        elif(isinstance(gridfitparams, dict)):
-            gridfitparams_hash = make_params_hash(gridfitparams)
+        if(isinstance(gridfitparams, dict)):
+            gridfitparams_key = self._make_pdf_key(gridfitparams)
+        elif(isinstance(gridfitparams, tuple)):
+            gridfitparams_key = gridfitparams
         else:
             raise TypeError(
-                'The gridfitparams argument must be of type dict or int!')
+                'The gridfitparams argument must be of type dict or tuple!')
 
-        if(gridfitparams_hash not in self._gridfitparams_hash_pdf_dict):
+        pdf = self._gridfitparams_hash_pdf_dict.get(gridfitparams_key)
+        if(pdf is None):
             raise KeyError(
                 'No PDF was created for the parameter set "%s"!' % (str(gridfitparams)))
 
-        pdf = self._gridfitparams_hash_pdf_dict[gridfitparams_hash]
+        return pdf
+
+    def get_pdf_by_index(self, idx):
+        """Retrieves the PDF object for the fit parameter permutation with the
+        given index within the ``gridfitparams_list`` property. This avoids
+        the creation of the PDF key from a parameter dictionary. If the PDF
+        set has been finalized via the ``finalize`` method, the PDF is
+        retrieved via list indexing only.
+
+        Parameters
+        ----------
+        idx : int
+            The index of the grid fit parameter permutation.
+
+        Returns
+        -------
+        pdf : pdf_type
+            The pdf_type object for the given parameter permutation.
+
+        Raises
+        ------
+        KeyError
+            If no PDF object was created for the given parameter permutation.
+        """
+        if(self._pdf_list is None):
+            return self.get_pdf(self.gridfitparams_keys[idx])
+
+        pdf = self._pdf_list[idx]
+        if(pdf is None):
+            raise KeyError(
+                'No PDF was created for the parameter set "%s"!' % (
+                    str(self.gridfitparams_list[idx])))
+
         return pdf
 
 
@@ -8,6 +8,13 @@ import inspect
 import numpy as np
 import sys
 
+# Try to load the numba JIT compiler.
+NUMBA_LOADED = True
+try:
+    import numba
+except ImportError:
+    NUMBA_LOADED = False
+
 
 class PyQualifier(object, metaclass=abc.ABCMeta):
     """This is the abstract base class for any Python qualifier class.
@@ -82,7 +89,7 @@ def typename(t):
 def classname(obj):
     """Returns the name of the class of the class instance ``obj``.
     """
-    return typename(type(obj))
+    return type(obj).__name__
 
 def get_byte_size_prefix(size):
     """Determines the biggest size prefix for the given size in bytes such that
@@ -2,7 +2,88 @@
 
 import numpy as np
 
-from skyllh.core.py import int_cast
+from skyllh.core.py import (
+    NUMBA_LOADED,
+    int_cast
+)
+
+if(NUMBA_LOADED):
+    import numba
+
+
+def _build_alias_table(probabilities):
+    """Builds the probability and alias tables of Walker's alias method for
+    the given normalized probabilities using Vose's O(N) algorithm. This
+    function gets compiled with numba, if numba is available.
+
+    Parameters
+    ----------
+    probabilities : 1D ndarray of float
+        The normalized probabilities of the N items.
+
+    Returns
+    -------
+    prob_table : 1D ndarray of float
+        The (N,)-shaped numpy ndarray holding the probability to select the
+        item itself, instead of its alias, for each item.
+    alias_table : 1D ndarray of int
+        The (N,)-shaped numpy ndarray holding the alias item index for each
+        item.
+    """
+    n = probabilities.shape[0]
+
+    scaled_probs = probabilities * n
+    prob_table = np.empty((n,), dtype=np.float64)
+    alias_table = np.empty((n,), dtype=np.int64)
+
+    # Use preallocated arrays as stacks for the indices of the items with a
+    # scaled probability smaller and larger than one.
+    small = np.empty((n,), dtype=np.int64)
+    large = np.empty((n,), dtype=np.int64)
+    n_small = 0
+    n_large = 0
+    for i in range(n):
+        if(scaled_probs[i] < 1):
+            small[n_small] = i
+            n_small += 1
+        else:
+            large[n_large] = i
+            n_large += 1
+
+    while((n_small > 0) and (n_large > 0)):
+        n_small -= 1
+        s = small[n_small]
+        n_large -= 1
+        l = large[n_large]
+
+        prob_table[s] = scaled_probs[s]
+        alias_table[s] = l
+
+        scaled_probs[l] = (scaled_probs[l] + scaled_probs[s]) - 1
+        if(scaled_probs[l] < 1):
+            small[n_small] = l
+            n_small += 1
+        else:
+            large[n_large] = l
+            n_large += 1
+
+    # The remaining items have a scaled probability of one, up to floating
+    # point precision.
+    while(n_large > 0):
+        n_large -= 1
+        prob_table[large[n_large]] = 1
+        alias_table[large[n_large]] = large[n_large]
+    while(n_small > 0):
+        n_small -= 1
+        prob_table[small[n_small]] = 1
+        alias_table[small[n_small]] = small[n_small]
+
+    return (prob_table, alias_table)
+
+
+if(NUMBA_LOADED):
+    _build_alias_table = numba.njit(cache=True)(_build_alias_table)
+
 
 class RandomStateService(object):
     """The RandomStateService class provides a container for a
@@ -56,3 +137,170 @@ class RandomStateService(object):
         self._seed = int_cast(seed, 'The seed argument must be None or '
             'castable to type int!', allow_None=True)
         self.random.seed(self._seed)
+
+
+class RandomChoice(object):
+    """The RandomChoice class provides the functionality of
+    ``numpy.random.RandomState.choice`` with replacement for a fixed set of
+    items and probabilities. The cumulative distribution function (CDF) of the
+    probabilities is computed only once at construction time, whereas
+    ``numpy.random.RandomState.choice`` validates the probabilities and
+    computes the CDF on each call. For the same random state, both methods
+    draw the same items.
+    """
+    def __init__(self, items, probabilities):
+        """Creates a new instance of RandomChoice.
+
+        Parameters
+        ----------
+        items : 1d ndarray
+            The (N,)-shaped numpy ndarray holding the items from which to draw.
+        probabilities : 1d ndarray
+            The (N,)-shaped numpy ndarray holding the probability for each
+            item. The probabilities do not need to be normalized.
+
+        Raises
+        ------
+        ValueError
+            If the shapes of the items and probabilities arrays do not match,
+            or if the probabilities are negative or do not have a positive
+            sum.
+        """
+        super(RandomChoice, self).__init__()
+
+        items = np.atleast_1d(items)
+        probabilities = np.atleast_1d(probabilities).astype(np.float64)
+
+        if(items.shape != probabilities.shape):
+            raise ValueError('The items array (shape %s) and the '
+                'probabilities array (shape %s) must have the same 1d '
+                'shape!'%(str(items.shape), str(probabilities.shape)))
+        if(np.any(probabilities < 0)):
+            raise ValueError('The probabilities must not be negative!')
+
+        cdf = np.cumsum(probabilities)
+        if(not (cdf[-1] > 0)):
+            raise ValueError('The sum of the probabilities must be positive!')
+        cdf /= cdf[-1]
+
+        self._items = items
+        self._cdf = cdf
+
+    @property
+    def items(self):
+        """(read-only) The numpy ndarray holding the items from which to draw.
+        """
+        return self._items
+
+    @property
+    def cdf(self):
+        """(read-only) The numpy ndarray holding the normalized cumulative
+        distribution function of the item probabilities.
+        """
+        return self._cdf
+
+    def __call__(self, rss, size):
+        """Draws ``size`` random items with replacement.
+
+        Parameters
+        ----------
+        rss : instance of RandomStateService
+            The instance of RandomStateService that should be used to draw
+            random numbers from.
+        size : int
+            The number of items to draw.
+
+        Returns
+        -------
+        items : ndarray
+            The (size,)-shaped numpy ndarray holding the drawn items.
+        """
+        uniform_values = rss.random.random_sample(size)
+        idxs = np.searchsorted(self._cdf, uniform_values, side='right')
+
+        return self._items[idxs]
+
+
+class AliasRandomChoice(object):
+    """The AliasRandomChoice class draws random items with replacement from a
+    fixed set of items with fixed probabilities using Walker's alias method.
+    The alias tables are built once in O(N) at construction time. Afterwards,
+    each item is drawn in constant time, independent of the number of items,
+    whereas the CDF lookup of ``RandomChoice`` takes O(log N) per item.
+
+    Note that the drawn items differ from the ones drawn by
+    ``numpy.random.RandomState.choice`` and ``RandomChoice`` for the same
+    random state, but follow the same distribution.
+
+    Without numba the alias tables are built in a Python loop, which is slow
+    for many items. In that case ``RandomChoice`` should be used instead.
+    """
+    def __init__(self, items, probabilities):
+        """Creates a new instance of AliasRandomChoice.
+
+        Parameters
+        ----------
+        items : 1d ndarray
+            The (N,)-shaped numpy ndarray holding the items from which to draw.
+        probabilities : 1d ndarray
+            The (N,)-shaped numpy ndarray holding the probability for each
+            item. The probabilities do not need to be normalized.
+
+        Raises
+        ------
+        ValueError
+            If the shapes of the items and probabilities arrays do not match,
+            or if the probabilities are negative or do not have a positive
+            sum.
+        """
+        super(AliasRandomChoice, self).__init__()
+
+        items = np.atleast_1d(items)
+        probabilities = np.atleast_1d(probabilities).astype(np.float64)
+
+        if(items.shape != probabilities.shape):
+            raise ValueError('The items array (shape %s) and the '
+                'probabilities array (shape %s) must have the same 1d '
+                'shape!'%(str(items.shape), str(probabilities.shape)))
+        if(np.any(probabilities < 0)):
+            raise ValueError('The probabilities must not be negative!')
+
+        p_sum = np.sum(probabilities)
+        if(not (p_sum > 0)):
+            raise ValueError('The sum of the probabilities must be positive!')
+
+        self._items = items
+        (self._prob_table, self._alias_table) = _build_alias_table(
+            probabilities / p_sum)
+
+    @property
+    def items(self):
+        """(read-only) The numpy ndarray holding the items from which to draw.
+        """
+        return self._items
+
+    def __call__(self, rss, size):
+        """Draws ``size`` random items with replacement.
+
+        Parameters
+        ----------
+        rss : instance of RandomStateService
+            The instance of RandomStateService that should be used to draw
+            random numbers from.
+        size : int
+            The number of items to draw.
+
+        Returns
+        -------
+        items : ndarray
+            The (size,)-shaped numpy ndarray holding the drawn items.
+        """
+        idxs = rss.random.randint(0, len(self._items), size=size)
+        uniform_values = rss.random.random_sample(size)
+
+        idxs = np.where(
+            uniform_values < self._prob_table[idxs],
+            idxs,
+            self._alias_table[idxs])
+
+        return self._items[idxs]
@@ -4,8 +4,65 @@ import abc
 
 import numpy as np
 
+from skyllh.core.py import NUMBA_LOADED
 from skyllh.core.times import TimeGenerator
 
+if(NUMBA_LOADED):
+    import numba
+
+    @numba.njit(cache=True)
+    def _fill_uniform(out, low, delta, next_double, state_address):
+        """Fills the given array with uniformly distributed random numbers
+        within the range [low, low+delta). The random numbers are drawn
+        directly from the bit generator of the random number generator via its
+        ctypes interface, so no Python call is made per random number and no
+        intermediate array is allocated. The drawn numbers are identical to
+        the ones of ``numpy.random.RandomState.uniform``.
+
+        Parameters
+        ----------
+        out : 1D ndarray
+            The array that should get filled with the random numbers.
+        low : float
+            The lower bound of the range.
+        delta : float
+            The width of the range.
+        next_double : ctypes function
+            The ``ctypes.next_double`` function of the bit generator.
+        state_address : int
+            The ``ctypes.state_address`` of the bit generator.
+        """
+        for i in range(out.shape[0]):
+            out[i] = low + delta*next_double(state_address)
+
+
+def _get_bit_generator(rng):
+    """Gets the bit generator of the given random number generator, which
+    provides the ctypes interface needed by the compiled kernels.
+
+    Parameters
+    ----------
+    rng : instance of numpy.random.Generator | numpy.random.RandomState
+        The random number generator.
+
+    Returns
+    -------
+    bit_generator : instance of numpy.random.BitGenerator | None
+        The bit generator of the random number generator, or None if it is
+        not accessible.
+    """
+    # numpy.random.Generator provides its bit generator publicly.
+    bit_generator = getattr(rng, 'bit_generator', None)
+    if(bit_generator is not None):
+        return bit_generator
+
+    # numpy.random.RandomState, which is used by RandomStateService, provides
+    # its bit generator only via the private ``_bit_generator`` attribute. If
+    # a numpy version does not provide it, None is returned and the callers
+    # fall back to the public random number methods, which draw the same
+    # numbers.
+    return getattr(rng, '_bit_generator', None)
+
 
 class DataScramblingMethod(object, metaclass=abc.ABCMeta):
     """Base class (type) for implementing a data scrambling method.
@@ -90,6 +147,23 @@ class UniformRAScramblingMethod(DataScramblingMethod):
             The given DataFieldRecordArray holding the scrambled data.
         """
         dt = data['ra'].dtype
+
+        # Draw the random numbers with the compiled kernel directly into an
+        # array of the final data type, if numba is available.
+        bit_generator = _get_bit_generator(rss.random)
+        if(NUMBA_LOADED and (bit_generator is not None)):
+            (ra_min, ra_max) = self.ra_range
+            ra = np.empty((len(data),), dtype=dt)
+            # The bit generator state is advanced outside of numpy, hence its
+            # lock needs to be held, like numpy does itself.
+            with bit_generator.lock:
+                _fill_uniform(
+                    ra, float(ra_min), float(ra_max - ra_min),
+                    bit_generator.ctypes.next_double,
+                    bit_generator.ctypes.state_address)
+            data['ra'] = ra
+            return data
+
         data['ra'] = rss.random.uniform(
             *self.ra_range, size=len(data)).astype(dt)
         return data
@@ -62,8 +62,10 @@ class SignalGenerator(object):
                 [0]+[shg.n_sources for shg in shg_list])),
             ('weight', np.float)
         ]
-        self._sig_candidates = np.empty(
-            (0,), dtype=sig_candidates_dtype, order='F')
+        # Collect the signal candidates of each source in a list and
+        # concatenate them once at the end, instead of growing the array for
+        # each source.
+        sig_candidates_list = []
 
         # Go through the source hypothesis groups to get the signal event
         # candidates.
@@ -77,12 +79,12 @@ class SignalGenerator(object):
             (ev_indices_list, flux_list) = sig_gen_method.calc_source_signal_mc_event_flux(
                 data_mc, shg
             )
+            mcweight = data_mc['mcweight']
             for (k, (ev_indices, flux)) in enumerate(zip(ev_indices_list, flux_list)):
-                ev = data_mc[ev_indices]
                 # The weight of the event specifies the number of signal events
                 # this one event corresponds to for the given reference flux.
                 # [weight] = GeV cm^2 sr * s * 1/(GeV cm^2 s sr)
-                weight = ev['mcweight'] * data.livetime * 86400 * flux
+                weight = mcweight[ev_indices] * data.livetime * 86400 * flux
 
                 sig_candidates = np.empty(
                     (len(ev_indices),), dtype=sig_candidates_dtype, order='F'
@@ -93,7 +95,13 @@ class SignalGenerator(object):
                 sig_candidates['shg_src_idx'] = k
                 sig_candidates['weight'] = weight
 
-                self._sig_candidates = np.append(self._sig_candidates, sig_candidates)
+                sig_candidates_list.append(sig_candidates)
+
+        if(len(sig_candidates_list) == 0):
+            self._sig_candidates = np.empty(
+                (0,), dtype=sig_candidates_dtype, order='F')
+        else:
+            self._sig_candidates = np.concatenate(sig_candidates_list)
 
         # Normalize the signal candidate weights.
         self._sig_candidates_weight_sum = np.sum(self._sig_candidates['weight'])
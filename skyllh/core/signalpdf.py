@@ -4,28 +4,92 @@
 likelihood function.
 """
 
+import math
 import numpy as np
 
 from skyllh.core import display
+from skyllh.core.config import CFG
 from skyllh.core.py import (
     classname,
     issequenceof
 )
 from skyllh.core.livetime import Livetime
 from skyllh.core.pdf import (
+    NUMBA_LOADED,
     PDFAxis,
     IsSignalPDF,
     MultiDimGridPDF,
     MultiDimGridPDFSet,
     NDPhotosplinePDF,
     SpatialPDF,
-    TimePDF
+    TimePDF,
+    make_pdf_ufunc
 )
 from skyllh.core.source_hypothesis import SourceHypoGroupManager
 from skyllh.physics.source import PointLikeSource
 from skyllh.physics.time_profile import TimeProfileModel
 
 
+def _gaussian_psf_prob(src_ra, src_dec, ra, dec, sigma):
+    """Calculates the gaussian PSF probability of a single event for a single
+    point-like source.
+
+    Parameters
+    ----------
+    src_ra : float
+        The right-ascention in radian of the source.
+    src_dec : float
+        The declination in radian of the source.
+    ra : float
+        The right-ascention in radian of the data event.
+    dec : float
+        The declination in radian of the data event.
+    sigma : float
+        The reconstruction uncertainty in radian of the data event.
+
+    Returns
+    -------
+    prob : float
+        The spatial signal probability of the event.
+    """
+    cos_r = (math.cos(src_ra - ra) * math.cos(src_dec) * math.cos(dec) +
+             math.sin(src_dec) * math.sin(dec))
+
+    # Handle possible floating precision errors.
+    if(cos_r < -1.):
+        cos_r = -1.
+    elif(cos_r > 1.):
+        cos_r = 1.
+    r = math.acos(cos_r)
+
+    sigma2 = sigma * sigma
+    return 0.5/(math.pi*sigma2) * math.exp(-0.5*r*r/sigma2)
+
+
+# The ufunc of the _gaussian_psf_prob function. It is created on first use by
+# the _get_gaussian_psf_prob_ufunc function, so it gets compiled only when
+# PDF ufuncs are enabled.
+_gaussian_psf_prob_ufunc = None
+
+
+def _get_gaussian_psf_prob_ufunc():
+    """Gets the ufunc of the ``_gaussian_psf_prob`` function. The ufunc is
+    created on the first call and cached.
+
+    Returns
+    -------
+    ufunc : callable
+        The ufunc calculating the gaussian PSF probability of the events.
+    """
+    global _gaussian_psf_prob_ufunc
+
+    if(_gaussian_psf_prob_ufunc is None):
+        _gaussian_psf_prob_ufunc = make_pdf_ufunc(
+            _gaussian_psf_prob, ['f8(f8,f8,f8,f8,f8)'])
+
+    return _gaussian_psf_prob_ufunc
+
+
 class GaussianPSFPointLikeSourceSignalSpatialPDF(SpatialPDF, IsSignalPDF):
     """This spatial signal PDF model describes the spatial PDF for a point
     source smeared with a 2D gaussian point-spread-function (PSF).
@@ -107,11 +171,22 @@ class GaussianPSFPointLikeSourceSignalSpatialPDF(SpatialPDF, IsSignalPDF):
         dec = get_data('dec')
         sigma = get_data('ang_err')
 
+        src_array = get_data('src_array')
+
+        grads = np.array([], dtype=np.float64)
+
+        if(NUMBA_LOADED and CFG['numba']['enable_pdf_ufuncs']):
+            # The new interface returns the pdf only for a single source, so
+            # we evaluate the compiled ufunc only for the first source.
+            prob = _get_gaussian_psf_prob_ufunc()(
+                src_array['ra'][0], src_array['dec'][0], ra, dec, sigma)
+            return (prob, grads)
+
         # Make the source position angles two-dimensional so the PDF value can
         # be calculated via numpy broadcasting automatically for several
         # sources. This is useful for stacking analyses.
-        src_ra = get_data('src_array')['ra'][:, np.newaxis]
-        src_dec = get_data('src_array')['dec'][:, np.newaxis]
+        src_ra = src_array['ra'][:, np.newaxis]
+        src_dec = src_array['dec'][:, np.newaxis]
 
         # Calculate the cosine of the distance of the source and the event on
         # the sphere.
@@ -125,8 +200,6 @@ class GaussianPSFPointLikeSourceSignalSpatialPDF(SpatialPDF, IsSignalPDF):
 
         prob = 0.5/(np.pi*sigma**2) * np.exp(-0.5*(r / sigma)**2)
 
-        grads = np.array([], dtype=np.float)
-
         # The new interface returns the pdf only for a single source.
         return (prob[0], grads)
 
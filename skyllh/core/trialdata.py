@@ -543,13 +543,15 @@ class TrialDataManager(object):
         self.calculate_pre_evt_sel_static_data_fields(src_hypo_group_manager)
 
         if(evt_sel_method is not None):
+            # Let the logger format the messages, so no strings are created
+            # for each trial when debug logging is disabled.
             logger.debug(
-                f'Performing event selection method '
-                f'"{classname(evt_sel_method)}".')
+                'Performing event selection method "%s".',
+                classname(evt_sel_method))
             selected_events = evt_sel_method.select_events(self._events, tl=tl)
             logger.debug(
-                f'Selected {len(selected_events)} out of {len(self._events)} '
-                 'events')
+                'Selected %d out of %d events',
+                len(selected_events), len(self._events))
             self.events = selected_events
 
         # Sort the events by the index field, if a field was provided.
@@ -70,10 +70,12 @@ class BackgroundI3SpatialPDF(SpatialPDF, UsesBinning, IsBackgroundPDF):
             raise ValueError('Some declination histogram bins for the spatial background PDF are empty, this must not happen! The empty bins are: {0}'.format(sinDec_binning.bincenters[h <= 0.]))
 
         # Create the logarithmic spline.
+        self._log_h = np.log(h)
         self._log_spline = scipy.interpolate.InterpolatedUnivariateSpline(
-            sinDec_binning.bincenters, np.log(h), k=self.spline_order_sinDec)
+            sinDec_binning.bincenters, self._log_h, k=self.spline_order_sinDec)
 
         # Save original spline.
+        self._orig_log_h = self._log_h
         self._orig_log_spline = self._log_spline
 
     @property
@@ -88,6 +90,16 @@ class BackgroundI3SpatialPDF(SpatialPDF, UsesBinning, IsBackgroundPDF):
             raise TypeError('The spline_order_sinDec property must be of type int!')
         self._spline_order_sinDec = order
 
+    @property
+    def prob_at_bincenters(self):
+        """(read-only) The 1d ndarray holding the spatial background
+        probability at the sin(dec) bin centers. Since the logarithmic spline
+        interpolates the logarithmic histogram values, these are the values the
+        ``get_prob`` method returns for events at the bin centers, but no
+        spline evaluation is required.
+        """
+        return 0.5 / np.pi * np.exp(self._log_h)
+
     def add_events(self, events):
         """Add events to spatial background PDF object and recalculate
         logarithmic spline function.
@@ -116,13 +128,15 @@ class BackgroundI3SpatialPDF(SpatialPDF, UsesBinning, IsBackgroundPDF):
         h = h / h.sum() / (bins[1:] - bins[:-1])
 
         # Create the updated logarithmic spline.
+        self._log_h = np.log(h)
         self._log_spline = scipy.interpolate.InterpolatedUnivariateSpline(
-            sinDec_binning.bincenters, np.log(h), k=self.spline_order_sinDec)
+            sinDec_binning.bincenters, self._log_h, k=self.spline_order_sinDec)
 
     def reset(self):
         """Reset the logarithmic spline to the original function, which was
         calculated when the object was initialized.
         """
+        self._log_h = self._orig_log_h
         self._log_spline = self._orig_log_spline
 
     def get_prob(self, tdm, fitparams=None, tl=None):
@@ -149,14 +163,34 @@ class BackgroundI3SpatialPDF(SpatialPDF, UsesBinning, IsBackgroundPDF):
             The spherical background probability of each data event.
         """
         with TaskTimer(tl, 'Evaluating bkg log-spline.'):
-            log_spline_val = self._log_spline(tdm.get_data('sin_dec'))
-
-        prob = 0.5 / np.pi * np.exp(log_spline_val)
+            prob = self.get_prob_from_sindec(tdm.get_data('sin_dec'))
 
-        grads = np.array([], dtype=np.float)
+        grads = np.array([], dtype=np.float64)
 
         return (prob, grads)
 
+    def get_prob_from_sindec(self, sin_dec):
+        """Calculates the spatial background probability on the sphere for the
+        given sin(declination) values. In contrast to the ``get_prob`` method,
+        this method takes the plain ndarray of the sin(dec) values, so no
+        TrialDataManager instance is required.
+
+        Parameters
+        ----------
+        sin_dec : 1d ndarray
+            The ndarray holding the sin(declination) values.
+
+        Returns
+        -------
+        prob : 1d ndarray
+            The spherical background probability for each sin(dec) value.
+        """
+        log_spline_val = self._log_spline(sin_dec)
+
+        prob = 0.5 / np.pi * np.exp(log_spline_val)
+
+        return prob
+
 
 class DataBackgroundI3SpatialPDF(BackgroundI3SpatialPDF):
     """This is the IceCube spatial background PDF, which gets constructed from
@@ -154,9 +154,10 @@ class PointLikeSourceI3DetSigYieldImplMethod(
         if(not issequenceof(sources, PointLikeSource)):
             raise TypeError('The source argument must be an instance of PointLikeSource!')
 
-        arr = np.empty((len(sources),), dtype=[('dec', np.float)])
-        for (i, src) in enumerate(sources):
-            arr['dec'][i] = src.dec
+        n_sources = len(sources)
+        arr = np.empty((n_sources,), dtype=[('dec', np.float64)])
+        arr['dec'] = np.fromiter(
+            (src.dec for src in sources), dtype=np.float64, count=n_sources)
 
         return arr
 
@@ -234,16 +235,17 @@ class FixedFluxPointLikeSourceI3DetSigYield(I3DetSigYield):
             and None is returned.
         """
         src_dec = np.atleast_1d(src['dec'])
+        src_sin_dec = np.sin(src_dec)
 
         # Create results array.
         values = np.zeros_like(src_dec, dtype=np.float64)
 
         # Create mask for all source declinations which are inside the
         # declination range.
-        mask = (np.sin(src_dec) >= self._sin_dec_binning.lower_edge)\
-              &(np.sin(src_dec) <= self._sin_dec_binning.upper_edge)
+        mask = (src_sin_dec >= self._sin_dec_binning.lower_edge)\
+              &(src_sin_dec <= self._sin_dec_binning.upper_edge)
 
-        values[mask] = np.exp(self._log_spl_sinDec(np.sin(src_dec[mask])))
+        values[mask] = np.exp(self._log_spl_sinDec(src_sin_dec[mask]))
 
         return (values, None)
 
@@ -441,13 +443,16 @@ class PowerLawFluxPointLikeSourceI3DetSigYield(I3DetSigYield):
         # Calculate the detector signal yield only for the sources for
         # which we actually have detector acceptance. For the other sources,
         # the detector signal yield is zero.
-        mask = (np.sin(src_dec) >= self._sin_dec_binning.lower_edge)\
-              &(np.sin(src_dec) <= self._sin_dec_binning.upper_edge)
+        src_sin_dec = np.sin(src_dec)
+        mask = (src_sin_dec >= self._sin_dec_binning.lower_edge)\
+              &(src_sin_dec <= self._sin_dec_binning.upper_edge)
 
+        src_sin_dec = src_sin_dec[mask]
+        src_gamma = src_gamma[mask]
         values[mask] = np.exp(self._log_spl_sinDec_gamma(
-            np.sin(src_dec[mask]), src_gamma[mask], grid=False))
+            src_sin_dec, src_gamma, grid=False))
         grads[mask] = values[mask] * self._log_spl_sinDec_gamma(
-            np.sin(src_dec[mask]), src_gamma[mask], grid=False, dy=1)
+            src_sin_dec, src_gamma, grid=False, dy=1)
 
         return (values, np.atleast_2d(grads))
 
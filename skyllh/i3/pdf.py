@@ -229,8 +229,13 @@ class I3EnergyPDF(EnergyPDF, UsesBinning):
         logE_binning = self.get_binning('log_energy')
         sinDec_binning = self.get_binning('sin_dec')
 
-        logE_idx = np.digitize(get_data('log_energy'), logE_binning.binedges) - 1
-        sinDec_idx = np.digitize(get_data('sin_dec'), sinDec_binning.binedges) - 1
+        # Note: For increasing bin edges, np.searchsorted with side='right'
+        #       gives the same indices as np.digitize, but without the
+        #       additional monotonicity check of np.digitize.
+        logE_idx = np.searchsorted(
+            logE_binning.binedges, get_data('log_energy'), side='right') - 1
+        sinDec_idx = np.searchsorted(
+            sinDec_binning.binedges, get_data('sin_dec'), side='right') - 1
 
         with TaskTimer(tl, 'Evaluating logE-sinDec histogram.'):
             prob = self._hist_logE_sinDec[(logE_idx,sinDec_idx)]
@@ -69,9 +69,10 @@ class I3EnergySigSetOverBkgPDFRatioSpline(SigSetOverBkgPDFRatio, IsParallelizabl
             if(not sigpdf.has_same_binning_as(self.backgroundpdf)):
                 raise ValueError('At least one signal PDF does not have the same binning as the background PDF!')
 
-        def create_log_ratio_spline(sigpdfset, bkgpdf, fillmethod, gridfitparams):
-            """Creates the signal/background ratio spline for the given signal
-            parameters.
+        def create_log_ratio_spline(sigpdfset, bkgpdf, fillmethod, gridfitparams_idx):
+            """Creates the signal/background ratio spline for the signal
+            parameters with the given index within the ``gridfitparams_list``
+            property of the signal PDF set.
 
             Returns
             -------
@@ -79,7 +80,7 @@ class I3EnergySigSetOverBkgPDFRatioSpline(SigSetOverBkgPDFRatio, IsParallelizabl
                 The spline of the logarithmic PDF ratio values.
             """
             # Get the signal PDF for the given signal parameters.
-            sigpdf = sigpdfset.get_pdf(gridfitparams)
+            sigpdf = sigpdfset.get_pdf_by_index(gridfitparams_idx)
 
             # Create the ratio array with the same shape than the background pdf
             # histogram.
@@ -97,7 +98,7 @@ class I3EnergySigSetOverBkgPDFRatioSpline(SigSetOverBkgPDFRatio, IsParallelizabl
             # ensure full coverage of the spline across the binning range.
             points_list = []
             for binning in sigpdf.binnings:
-                points = binning.bincenters
+                points = np.copy(binning.bincenters)
                 (points[0], points[-1]) = (binning.lower_edge, binning.upper_edge)
                 points_list.append(points)
 
@@ -115,8 +116,8 @@ class I3EnergySigSetOverBkgPDFRatioSpline(SigSetOverBkgPDFRatio, IsParallelizabl
         # need to create PDF ratio arrays.
         gridfitparams_list = self.signalpdfset.gridfitparams_list
 
-        args_list = [ ((signalpdfset, backgroundpdf, self.fillmethod, gridfitparams),{})
-                     for gridfitparams in gridfitparams_list ]
+        args_list = [ ((signalpdfset, backgroundpdf, self.fillmethod, gridfitparams_idx),{})
+                     for gridfitparams_idx in range(len(gridfitparams_list)) ]
 
         log_ratio_spline_list = parallelize(
             create_log_ratio_spline, args_list, self.ncpu, ppbar=ppbar)
@@ -171,6 +171,7 @@ class SignalI3EnergyPDFSet(PDFSet, IsSignalPDF, IsParallelizable):
         # the hash of the individual parameters as key.
         for (gridfitparams, i3energypdf) in zip(self.gridfitparams_list, i3energypdf_list):
             self.add_pdf(i3energypdf, gridfitparams)
+        self.finalize()
 
     def assert_is_valid_for_exp_data(self, data_exp):
         """Checks if this signal energy PDF is valid for all the given
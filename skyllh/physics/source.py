@@ -11,7 +11,6 @@ import numpy as np
 from skyllh.core.py import (
     ObjectCollection,
     classname,
-    float_cast,
     issequence
 )
 
@@ -19,6 +18,8 @@ from skyllh.core.py import (
 class SourceLocation(object):
     """Stores the location of a source, i.e. right-ascention and declination.
     """
+    __slots__ = ('_ra', '_dec')
+
     def __init__(self, ra, dec):
         self.ra = ra
         self.dec = dec
@@ -30,8 +31,10 @@ class SourceLocation(object):
         return self._ra
     @ra.setter
     def ra(self, v):
-        v = float_cast(v, 'The ra property must be castable to type float!')
-        self._ra = v
+        try:
+            self._ra = float(v)
+        except (TypeError, ValueError):
+            raise TypeError('The ra property must be castable to type float!')
 
     @property
     def dec(self):
@@ -40,14 +43,19 @@ class SourceLocation(object):
         return self._dec
     @dec.setter
     def dec(self, v):
-        v = float_cast(v, 'The dec property must be castable to type float!')
-        self._dec = v
+        try:
+            self._dec = float(v)
+        except (TypeError, ValueError):
+            raise TypeError('The dec property must be castable to type float!')
 
 
 class SourceModel(object):
     """The base class for all source models in Skyllh. Each source has a central
     location given by a right-ascention and declination location.
     """
+    # Use slots to keep the memory footprint of large source catalogs small.
+    __slots__ = ('_loc',)
+
     def __init__(self, ra, dec):
         self.loc = SourceLocation(ra, dec)
 
@@ -74,6 +82,11 @@ class SourceCollection(ObjectCollection):
     """This class describes a collection of sources. It can be used to group
     sources into a single object, for instance for a stacking analysis.
     """
+    # The dispatch table for the ``cast`` method. It maps the exact type of
+    # the object to cast to the function performing the cast. It gets filled
+    # at the end of this module, when all source classes are defined.
+    _cast_dispatch = dict()
+
     @staticmethod
     def cast(obj, errmsg):
         """Casts the given object to a SourceCollection object. If the cast
@@ -91,6 +104,12 @@ class SourceCollection(ObjectCollection):
         TypeError
             If the cast fails.
         """
+        cast_func = SourceCollection._cast_dispatch.get(type(obj))
+        if(cast_func is not None):
+            return cast_func(obj)
+
+        # Fall back to the general checks for types, which are not in the
+        # dispatch table, e.g. user defined source classes or sequences.
         if(isinstance(obj, SourceModel)):
             obj = SourceCollection(SourceModel, [obj])
         if(not isinstance(obj, SourceCollection)):
@@ -170,6 +189,8 @@ class PointLikeSource(SourceModel):
     """The PointLikeSource class is a source model for a point-like source
     object in the sky at a given location (right-ascention and declination).
     """
+    __slots__ = ()
+
     def __init__(self, ra, dec):
         super(PointLikeSource, self).__init__(ra, dec)
 
@@ -198,6 +219,18 @@ class PointLikeSource(SourceModel):
 
 class PointLikeSourceCollection(SourceCollection):
     """Describes a collection of point-like sources.
+
+    The right-ascention and declination values of the sources are stored
+    additionally in contiguous numpy ndarrays, which are updated whenever a
+    source is added to or removed from the collection. Hence, the source
+    locations are taken at the time the source gets added to the collection.
+    Changing the location of a source afterwards does not change the location
+    arrays of the collection, i.e. the ``ra`` and ``dec`` properties are
+    snapshots of the source locations.
+
+    Sources can only be added and removed through the ``add`` and ``pop``
+    methods. Hence, the ``objects`` and ``sources`` properties return a tuple
+    instead of the internal list of sources.
     """
     def __init__(self, sources=None):
         """Creates a new collection of PointLikeSource objects.
@@ -208,20 +241,154 @@ class PointLikeSourceCollection(SourceCollection):
             The sequence of PointLikeSource objects this collection should be
             initalized with.
         """
+        # The location arrays must exist before the base class adds the given
+        # sources.
+        self._ra_arr = np.empty((0,), dtype=np.float64)
+        self._dec_arr = np.empty((0,), dtype=np.float64)
+
         super(PointLikeSourceCollection, self).__init__(
             source_type=PointLikeSource, sources=sources)
 
+    @classmethod
+    def from_arrays(cls, ra, dec):
+        """Creates a new PointLikeSourceCollection from the given arrays of
+        source locations. The location arrays of the collection are filled
+        directly from the given arrays, instead of source by source.
+
+        Parameters
+        ----------
+        ra : 1D array_like of float
+            The right-ascention angles in radian of the sources.
+        dec : 1D array_like of float
+            The declination angles in radian of the sources.
+
+        Returns
+        -------
+        collection : instance of PointLikeSourceCollection
+            The new collection of PointLikeSource instances.
+
+        Raises
+        ------
+        ValueError
+            If the ra and dec arrays do not have the same length.
+        """
+        ra = np.array(ra, dtype=np.float64, ndmin=1)
+        dec = np.array(dec, dtype=np.float64, ndmin=1)
+        if(ra.shape != dec.shape):
+            raise ValueError('The ra and dec arrays must have the same '
+                'shape! Currently they have the shapes %s and %s!'%(
+                    str(ra.shape), str(dec.shape)))
+
+        collection = cls()
+        collection._objects = [
+            PointLikeSource(src_ra, src_dec)
+            for (src_ra, src_dec) in zip(ra.tolist(), dec.tolist())
+        ]
+        collection._ra_arr = ra
+        collection._dec_arr = dec
+
+        return collection
+
+    @property
+    def objects(self):
+        """(read-only) The tuple of the sources of this collection. A tuple is
+        returned, so the sources cannot be changed without updating the
+        location arrays.
+        """
+        return tuple(self._objects)
+
     @property
     def ra(self):
-        """(read-only) The ndarray with the right-ascention of all the sources.
+        """(read-only) The read-only ndarray with the right-ascention of all
+        the sources.
         """
-        return np.array([ src.ra for src in self ])
+        ra = self._ra_arr[:len(self)]
+        ra.setflags(write=False)
+        return ra
 
     @property
     def dec(self):
-        """(read-only) The ndarray with the declination of all the sources.
+        """(read-only) The read-only ndarray with the declination of all the
+        sources.
+        """
+        dec = self._dec_arr[:len(self)]
+        dec.setflags(write=False)
+        return dec
+
+    def _reserve_loc_arrays(self, n_old, n):
+        """Ensures that the location arrays can hold at least ``n`` sources,
+        keeping the first ``n_old`` location values.
+        The capacity of the arrays is at least doubled in order to keep the
+        number of reallocations low when sources are added one by one.
         """
-        return np.array([ src.dec for src in self ])
+        capacity = len(self._ra_arr)
+        if(n <= capacity):
+            return
+
+        capacity = max(n, 2*capacity)
+
+        ra_arr = np.empty((capacity,), dtype=np.float64)
+        ra_arr[:n_old] = self._ra_arr[:n_old]
+        self._ra_arr = ra_arr
+
+        dec_arr = np.empty((capacity,), dtype=np.float64)
+        dec_arr[:n_old] = self._dec_arr[:n_old]
+        self._dec_arr = dec_arr
+
+    def add(self, obj):
+        """Adds the given source or collection of sources to this collection
+        and updates the location arrays.
+
+        Parameters
+        ----------
+        obj : PointLikeSource instance | ObjectCollection of PointLikeSource
+            The source or the collection of sources that should be added.
+
+        Returns
+        -------
+        self : PointLikeSourceCollection
+            The instance of this PointLikeSourceCollection, in order to be able
+            to chain several ``add`` calls.
+        """
+        n_old = len(self)
+        super(PointLikeSourceCollection, self).add(obj)
+        n = len(self)
+
+        self._reserve_loc_arrays(n_old, n)
+        for idx in range(n_old, n):
+            src = self._objects[idx]
+            self._ra_arr[idx] = src.ra
+            self._dec_arr[idx] = src.dec
+
+        return self
+    __iadd__ = add
+
+    def pop(self, index=None):
+        """Removes and returns the source at the given index (default last) and
+        updates the location arrays.
+
+        Parameters
+        ----------
+        index : int | None
+            The index of the source to remove. If set to None, the index of the
+            last source is used.
+
+        Returns
+        -------
+        obj : PointLikeSource
+            The removed source.
+        """
+        n = len(self)
+        if(index is None):
+            index = n-1
+        obj = super(PointLikeSourceCollection, self).pop(index)
+
+        if(index < 0):
+            index += n
+        self._ra_arr[index:n-1] = self._ra_arr[index+1:n]
+        self._dec_arr[index:n-1] = self._dec_arr[index+1:n]
+
+        return obj
 
 
 class PointLikeSourceCatalog(Catalog):
@@ -242,3 +409,24 @@ class PointLikeSourceCatalog(Catalog):
         """
         super(PointLikeSourceCatalog, self).__init__(
             name=name, source_type=PointLikeSource, sources=sources)
+
+
+def _cast_source_to_source_collection(src):
+    """Casts the given source to a SourceCollection holding only this source.
+    """
+    return SourceCollection(SourceModel, [src])
+
+def _cast_source_collection_to_source_collection(src_collection):
+    """Returns the given SourceCollection instance as it is.
+    """
+    return src_collection
+
+SourceCollection._cast_dispatch.update(
+    dict([
+        (cls, _cast_source_to_source_collection)
+        for cls in (SourceModel, PointLikeSource)
+    ] + [
+        (cls, _cast_source_collection_to_source_collection)
+        for cls in (SourceCollection, Catalog, PointLikeSourceCollection,
+                    PointLikeSourceCatalog)
+    ]))
@@ -7,7 +7,10 @@ import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.colors import LogNorm
 
-from skyllh.core.py import classname
+from skyllh.core.py import (
+    classname,
+    int_cast
+)
 from skyllh.core.source_hypothesis import SourceHypoGroupManager
 from skyllh.core.storage import DataFieldRecordArray
 from skyllh.core.trialdata import TrialDataManager
@@ -55,7 +58,56 @@ class BackgroundI3SpatialPDFPlotter(object):
                 'TrialDataManager!')
         self._tdm = obj
 
-    def plot(self, src_hypo_group_manager, axes):
+    def _eval_pdf_on_grid(
+            self, src_hypo_group_manager, sin_dec_binning, ra_axis, n_ra):
+        """Evaluates the PDF for all (sin_dec, ra) grid points with a single
+        ``get_prob`` call.
+
+        Returns
+        -------
+        pdfprobs : (n_sin_dec, n_ra)-shaped 2d ndarray
+            The PDF values in the shape as needed by imshow.
+        """
+        # Create the right-ascention bin centers.
+        ra_binedges = np.linspace(ra_axis.vmin, ra_axis.vmax, n_ra+1)
+        ra_bincenters = 0.5*(ra_binedges[:-1] + ra_binedges[1:])
+
+        # Create the events for all (sin_dec, ra) grid points at once. The
+        # event order is such that the probabilities can be reshaped directly
+        # into the (sin_dec, ra) shape as needed by imshow.
+        (sin_dec_grid, ra_grid) = np.meshgrid(
+            sin_dec_binning.bincenters, ra_bincenters, indexing='ij')
+        events = DataFieldRecordArray({
+                'sin_dec': sin_dec_grid.ravel(),
+                'ra': ra_grid.ravel()
+            }, copy=False)
+
+        self._tdm.initialize_trial(src_hypo_group_manager, events)
+
+        (event_probs, grads) = self._pdf.get_prob(self._tdm)
+
+        pdfprobs = event_probs.reshape((sin_dec_binning.nbins, n_ra))
+
+        return pdfprobs
+
+    def _get_prob_at_sin_dec_bincenters(self, sin_dec_binning):
+        """Gets the PDF values at the sin(dec) bin centers. If the PDF class
+        does not override the ``get_prob_from_sindec`` method, the known PDF
+        values at the bin centers are used directly. Otherwise the
+        ``get_prob_from_sindec`` method is called for the bin centers.
+
+        Returns
+        -------
+        prob : (n_sin_dec,)-shaped 1d ndarray
+            The PDF values at the sin(dec) bin centers.
+        """
+        if(type(self._pdf).get_prob_from_sindec is
+           BackgroundI3SpatialPDF.get_prob_from_sindec):
+            return self._pdf.prob_at_bincenters
+
+        return self._pdf.get_prob_from_sindec(sin_dec_binning.bincenters)
+
+    def plot(self, src_hypo_group_manager, axes, n_ra=1):
         """Plots the spatial PDF. It uses the sin(dec) binning of the PDF to
         propperly represent the resolution of the PDF in the drawing.
 
@@ -66,6 +118,15 @@ class BackgroundI3SpatialPDFPlotter(object):
             hypotheses.
         axes : mpl.axes.Axes
             The matplotlib Axes object on which the PDF should get drawn to.
+        n_ra : int
+            The number of right-ascention points for which the PDF should get
+            evaluated. By construction the BackgroundI3SpatialPDF does not
+            depend on right-ascention. Hence, the default is a single point.
+            If the PDF class does not override the ``get_prob`` method, the
+            PDF is evaluated only at the sin(dec) bin centers via the
+            ``_get_prob_at_sin_dec_bincenters`` method. Otherwise the PDF is
+            evaluated for all (sin_dec, ra) grid points with a single
+            ``get_prob`` call.
 
         Returns
         -------
@@ -78,31 +139,27 @@ class BackgroundI3SpatialPDFPlotter(object):
         if(not isinstance(axes, Axes)):
             raise TypeError('The axes argument must be an instance of '
                 'matplotlib.axes.Axes!')
+        n_ra = int_cast(n_ra, 'The n_ra argument must be castable to type '
+            'int!')
+        if(n_ra < 1):
+            raise ValueError('The n_ra argument must be at least 1!')
 
-        # By construction the BackgroundI3SpatialPDF does not depend on
-        # right-ascention. Hence, we only need a single bin for the
-        # right-ascention.
         sin_dec_binning = self.pdf.get_binning('sin_dec')
-        pdfprobs = np.zeros((1, sin_dec_binning.nbins))
-
-        sin_dec_points = sin_dec_binning.bincenters
-        events = DataFieldRecordArray(np.zeros((pdfprobs.size,),
-                          dtype=[('sin_dec', np.float)]))
-        for (i, sin_dec) in enumerate(sin_dec_points):
-            events['sin_dec'][i] = sin_dec
-
-        self._tdm.initialize_for_new_trial(src_hypo_group_manager, events)
-
-        event_probs = self._pdf.get_prob(self._tdm)
+        ra_axis = self.pdf.axes.get_axis('ra')
 
-        for i in range(len(events)):
-            pdfprobs[0,i] = event_probs[i]
+        if(type(self._pdf).get_prob is BackgroundI3SpatialPDF.get_prob):
+            # The PDF does not depend on right-ascention. So no events need to
+            # get created and evaluated.
+            prob = self._get_prob_at_sin_dec_bincenters(sin_dec_binning)
+            pdfprobs = np.repeat(prob[:, np.newaxis], n_ra, axis=1)
+        else:
+            pdfprobs = self._eval_pdf_on_grid(
+                src_hypo_group_manager, sin_dec_binning, ra_axis, n_ra)
 
-        ra_axis = self.pdf.axes.get_axis('ra')
         (left, right, bottom, top) = (
             ra_axis.vmin, ra_axis.vmax,
             sin_dec_binning.lower_edge, sin_dec_binning.upper_edge)
-        img = axes.imshow(pdfprobs.T, extent=(left, right, bottom, top), origin='lower',
+        img = axes.imshow(pdfprobs, extent=(left, right, bottom, top), origin='lower',
                     norm=LogNorm(), interpolation='none')
         axes.set_xlabel('ra')
         axes.set_ylabel('sin_dec')
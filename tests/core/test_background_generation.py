@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import unittest
+import numpy as np
+import weakref
+
+from skyllh.core import background_generation
+from skyllh.core.background_generation import MCDataSamplingBkgGenMethod
+from skyllh.core.config import CFG
+from skyllh.core.optimize import EventSelectionMethod
+from skyllh.core.random import (
+    AliasRandomChoice,
+    RandomChoice,
+    RandomStateService
+)
+from skyllh.core.source_hypothesis import SourceHypoGroupManager
+from skyllh.core.storage import DataFieldRecordArray
+
+
+class DatasetStub(object):
+    name = 'TestDataset'
+
+
+class DatasetDataStub(object):
+    def __init__(self, n_events):
+        rss = RandomStateService(seed=0)
+        self.exp_field_names = list(set(
+            CFG['dataset']['analysis_required_exp_field_names'] + ['dec']))
+        data = dict([
+            (name, rss.random.uniform(size=n_events))
+            for name in self.exp_field_names
+        ])
+        data['mcweight'] = rss.random.uniform(size=n_events)
+        self.mc = DataFieldRecordArray(data, copy=False)
+
+
+def get_event_prob(dataset, data, events):
+    return events['mcweight'] / np.sum(events['mcweight'])
+
+
+def get_mean(dataset, data, events):
+    return 100.
+
+
+def get_weighted_mean(dataset, data, events):
+    return 100. * np.sum(events['mcweight']) / np.sum(data.mc['mcweight'])
+
+
+class DecEventSelectionMethodStub(EventSelectionMethod):
+    """Pre-selects all events with a declination value larger than 0.5.
+    """
+    def __init__(self):
+        super(DecEventSelectionMethodStub, self).__init__(
+            SourceHypoGroupManager())
+
+    def source_to_array(self, sources):
+        return None
+
+    def select_events(self, events, retidxs=False, tl=None):
+        idxs = np.nonzero(events['dec'] > 0.5)[0]
+        if(retidxs):
+            return (events[idxs], idxs)
+        return events[idxs]
+
+
+class TestMCDataSamplingBkgGenMethod(unittest.TestCase):
+    def setUp(self):
+        self.dataset = DatasetStub()
+        self.data = DatasetDataStub(1000)
+        self.method = MCDataSamplingBkgGenMethod(
+            get_event_prob, get_mean, keep_mc_data_fields=['mcweight'])
+
+    def test_generate_events(self):
+        rss = RandomStateService(seed=1)
+        (n_bkg, bkg_events) = self.method.generate_events(
+            rss, self.dataset, self.data)
+
+        self.assertEqual(len(bkg_events), n_bkg)
+        self.assertEqual(
+            set(bkg_events.field_name_list), set(self.data.exp_field_names))
+
+    def test_generate_events_batch(self):
+        rss = RandomStateService(seed=1)
+        result_list = self.method.generate_events_batch(
+            rss, self.dataset, self.data, 5)
+
+        self.assertEqual(len(result_list), 5)
+        for (n_bkg, bkg_events) in result_list:
+            self.assertEqual(len(bkg_events), n_bkg)
+            self.assertEqual(
+                set(bkg_events.field_name_list),
+                set(self.data.exp_field_names))
+
+    def test_generate_events_batch_no_poisson(self):
+        rss = RandomStateService(seed=1)
+        result_list = self.method.generate_events_batch(
+            rss, self.dataset, self.data, 3, mean=10, poisson=False)
+
+        self.assertEqual(
+            [(n_bkg, len(bkg_events)) for (n_bkg, bkg_events) in result_list],
+            [(10, 10)]*3)
+
+    @unittest.skipIf(
+        not background_generation.NUMBA_LOADED, 'numba is not available')
+    def test_generate_events_alias_random_choice(self):
+        self.method.generate_events(
+            RandomStateService(seed=1), self.dataset, self.data)
+        self.assertIsInstance(
+            self.method._cache_random_choice, AliasRandomChoice)
+
+    def test_generate_events_without_numba(self):
+        """Checks that the MC events are drawn via the CDF of the background
+        probabilities without numba, i.e. identical to
+        numpy.random.RandomState.choice.
+        """
+        numba_loaded = background_generation.NUMBA_LOADED
+        background_generation.NUMBA_LOADED = False
+        try:
+            (n_bkg, bkg_events) = self.method.generate_events(
+                RandomStateService(seed=1), self.dataset, self.data,
+                mean=50, poisson=False)
+        finally:
+            background_generation.NUMBA_LOADED = numba_loaded
+
+        self.assertIsInstance(self.method._cache_random_choice, RandomChoice)
+
+        rss = RandomStateService(seed=1)
+        idxs = rss.random.choice(
+            len(self.data.mc), size=50,
+            p=get_event_prob(self.dataset, self.data, self.data.mc),
+            replace=True)
+        self.assertEqual(n_bkg, 50)
+        np.testing.assert_array_equal(
+            bkg_events['dec'], self.data.mc['dec'][idxs])
+
+    def test_data_cache(self):
+        """Checks that the MC background event probabilities are calculated
+        only once for each DatasetData instance, when generating events for
+        several datasets alternately.
+        """
+        n_calls = []
+        def counting_get_event_prob(dataset, data, events):
+            n_calls.append(id(data))
+            return get_event_prob(dataset, data, events)
+
+        method = MCDataSamplingBkgGenMethod(
+            counting_get_event_prob, get_mean,
+            keep_mc_data_fields=['mcweight'], data_cache_size=2)
+        data_list = [self.data, DatasetDataStub(500)]
+
+        rss = RandomStateService(seed=1)
+        for i in range(3):
+            for data in data_list:
+                method.generate_events(rss, self.dataset, data)
+        self.assertEqual(len(n_calls), 2)
+
+        # A third data instance evicts the least recently used one.
+        method.generate_events(rss, self.dataset, DatasetDataStub(200))
+        self.assertEqual(len(n_calls), 3)
+        method.generate_events(rss, self.dataset, data_list[1])
+        self.assertEqual(len(n_calls), 3)
+        method.generate_events(rss, self.dataset, data_list[0])
+        self.assertEqual(len(n_calls), 4)
+
+
+    def test_data_cache_weak_reference(self):
+        """Checks that the data cache does not keep the DatasetData instances
+        alive, and that the cache entry of a deleted DatasetData instance is
+        not used for a new instance.
+        """
+        n_calls = []
+        def counting_get_event_prob(dataset, data, events):
+            n_calls.append(id(data))
+            return get_event_prob(dataset, data, events)
+
+        method = MCDataSamplingBkgGenMethod(
+            counting_get_event_prob, get_mean,
+            keep_mc_data_fields=['mcweight'])
+        self.assertIsNone(method.data_cache_size)
+
+        rss = RandomStateService(seed=1)
+        data = DatasetDataStub(100)
+        data_ref = weakref.ref(data)
+        method.generate_events(rss, self.dataset, data)
+        self.assertEqual(len(method._data_cache_dict), 1)
+
+        del data
+        gc.collect()
+        self.assertIsNone(data_ref())
+
+        # Simulate a new DatasetData instance, which got the id of the deleted
+        # instance.
+        data = DatasetDataStub(100)
+        (data_id,) = method._data_cache_dict.keys()
+        method._data_cache_dict[id(data)] = method._data_cache_dict.pop(
+            data_id)
+        method._cache_data_id = id(data)
+        method.generate_events(rss, self.dataset, data)
+        self.assertEqual(len(n_calls), 2)
+        self.assertEqual(len(method._data_cache_dict), 1)
+
+        # The cache entry of a deleted DatasetData instance is dropped, when a
+        # new cache entry is created.
+        other_data = DatasetDataStub(100)
+        del data
+        gc.collect()
+        method.generate_events(rss, self.dataset, other_data)
+        self.assertEqual(len(n_calls), 3)
+        self.assertEqual(
+            list(method._data_cache_dict.keys()), [id(other_data)])
+
+
+class TestMCDataSamplingBkgGenMethodPreSelection(unittest.TestCase):
+    """Tests the background event generation with a pre-selection of the MC
+    events.
+    """
+    def setUp(self):
+        self.dataset = DatasetStub()
+        self.data = DatasetDataStub(1000)
+
+        mc = self.data.mc
+        self.selected_idxs = np.nonzero(mc['dec'] > 0.5)[0]
+        self.mean_selected = get_weighted_mean(
+            self.dataset, self.data, mc[self.selected_idxs])
+
+    def _generate_events(self, unique_events, mean):
+        method = MCDataSamplingBkgGenMethod(
+            get_event_prob, get_weighted_mean, unique_events=unique_events,
+            keep_mc_data_fields=['mcweight'],
+            pre_event_selection_method=DecEventSelectionMethodStub())
+        (n_bkg, bkg_events) = method.generate_events(
+            RandomStateService(seed=1), self.dataset, self.data, mean=mean,
+            poisson=False)
+
+        # The probabilities of the pre-selected MC events are normalized to
+        # unity, independent of the given mean.
+        self.assertAlmostEqual(
+            np.sum(method._cache_mc_event_bkg_prob_pre_selected), 1.)
+        self.assertTrue(np.all(bkg_events['dec'] > 0.5))
+
+        # The batch generation must select the same number of events.
+        result_list = method.generate_events_batch(
+            RandomStateService(seed=1), self.dataset, self.data, 2, mean=mean,
+            poisson=False)
+        self.assertEqual(
+            [(n, len(events)) for (n, events) in result_list],
+            [(n_bkg, len(bkg_events))]*2)
+
+        return (n_bkg, bkg_events)
+
+    def _test_default_mean(self, unique_events):
+        (n_bkg, bkg_events) = self._generate_events(unique_events, None)
+
+        self.assertEqual(n_bkg, 100)
+        self.assertEqual(len(bkg_events), int(round(self.mean_selected)))
+
+    def _test_explicit_mean(self, unique_events):
+        """The number of pre-selected background events must scale with the
+        given mean.
+        """
+        mean_total = get_weighted_mean(self.dataset, self.data, self.data.mc)
+        for mean in (200, 400):
+            (n_bkg, bkg_events) = self._generate_events(unique_events, mean)
+
+            self.assertEqual(n_bkg, mean)
+            self.assertEqual(
+                len(bkg_events),
+                int(round(mean * self.mean_selected / mean_total)))
+
+    def test_default_mean(self):
+        self._test_default_mean(unique_events=False)
+
+    def test_default_mean_unique_events(self):
+        self._test_default_mean(unique_events=True)
+
+    def test_explicit_mean(self):
+        self._test_explicit_mean(unique_events=False)
+
+    def test_explicit_mean_unique_events(self):
+        self._test_explicit_mean(unique_events=True)
+
+
+if(__name__ == '__main__'):
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import numpy as np
+
+from skyllh.core.parameters import (
+    ParameterGrid,
+    ParameterGridSet
+)
+from skyllh.core.pdf import (
+    PDF,
+    PDFSet
+)
+
+
+class PDFStub(PDF):
+    def get_prob(self, tdm, params=None, tl=None):
+        pass
+
+
+class TestPDFSet(unittest.TestCase):
+    def setUp(self):
+        self.pdfset = PDFSet(
+            pdf_type=PDFStub,
+            fitparams_grid_set=ParameterGridSet([
+                ParameterGrid('gamma', np.array([1., 2., 3.])),
+                ParameterGrid('a', np.array([0., 1.]))
+            ]))
+
+        # Add a PDF for all but the last grid fit parameter permutation.
+        self.pdfs = []
+        for gridfitparams in self.pdfset.gridfitparams_list[:-1]:
+            pdf = PDFStub()
+            self.pdfset.add_pdf(pdf, gridfitparams)
+            self.pdfs.append(pdf)
+
+    def test_pdf_keys(self):
+        pdf_keys = self.pdfset.pdf_keys
+
+        self.assertEqual(len(pdf_keys), 5)
+        for (pdf_key, gridfitparams) in zip(
+                pdf_keys, self.pdfset.gridfitparams_list):
+            self.assertIsInstance(pdf_key, tuple)
+            self.assertEqual(dict(pdf_key), gridfitparams)
+
+    def test_get_pdf(self):
+        for (pdf, pdf_key) in zip(self.pdfs, self.pdfset.pdf_keys):
+            self.assertIs(self.pdfset.get_pdf(pdf_key), pdf)
+            self.assertIs(self.pdfset.get_pdf(dict(pdf_key)), pdf)
+
+        with self.assertRaises(KeyError):
+            self.pdfset.get_pdf({'gamma': 3., 'a': 1.})
+        with self.assertRaises(TypeError):
+            self.pdfset.get_pdf([('gamma', 1.), ('a', 0.)])
+
+    def test_get_pdf_dict_order(self):
+        """The PDF keys must not depend on the order of the dictionary items.
+        """
+        pdf = self.pdfs[3]
+        self.assertIs(self.pdfset.get_pdf({'a': 1., 'gamma': 2.}), pdf)
+        self.assertIs(self.pdfset.get_pdf({'gamma': 2., 'a': 1.}), pdf)
+
+        with self.assertRaises(KeyError):
+            self.pdfset.add_pdf(PDFStub(), {'a': 0., 'gamma': 1.})
+
+    def test_get_pdf_by_index(self):
+        for finalize in (False, True):
+            if(finalize):
+                self.pdfset.finalize()
+            for (idx, pdf) in enumerate(self.pdfs):
+                self.assertIs(self.pdfset.get_pdf_by_index(idx), pdf)
+
+            # No PDF was added for the last permutation.
+            with self.assertRaises(KeyError):
+                self.pdfset.get_pdf_by_index(5)
+
+    def test_add_pdf_after_finalize(self):
+        """Adding a PDF must invalidate the index based PDF list.
+        """
+        self.pdfset.finalize()
+
+        pdf = PDFStub()
+        self.pdfset.add_pdf(pdf, self.pdfset.gridfitparams_list[-1])
+        self.assertIs(self.pdfset.get_pdf_by_index(5), pdf)
+
+        self.pdfset.finalize()
+        self.assertIs(self.pdfset.get_pdf_by_index(5), pdf)
+        self.assertIs(self.pdfset.get_pdf_by_index(0), self.pdfs[0])
+
+
+if(__name__ == '__main__'):
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import numpy as np
+
+from skyllh.core import random
+from skyllh.core.random import (
+    AliasRandomChoice,
+    RandomChoice,
+    RandomStateService
+)
+
+
+class TestRandomChoice(unittest.TestCase):
+    def setUp(self):
+        self.items = np.arange(100, 150)
+        self.p = np.random.RandomState(seed=0).uniform(size=len(self.items))
+        self.p /= np.sum(self.p)
+
+    def test_call(self):
+        """Checks that RandomChoice draws the same items as
+        numpy.random.RandomState.choice with replacement.
+        """
+        choice = RandomChoice(self.items, self.p)
+
+        rss = RandomStateService(seed=1)
+        drawn_items = np.concatenate((choice(rss, 1000), choice(rss, 10)))
+
+        rss = RandomStateService(seed=1)
+        exp_items = np.concatenate((
+            rss.random.choice(self.items, size=1000, p=self.p, replace=True),
+            rss.random.choice(self.items, size=10, p=self.p, replace=True)))
+
+        np.testing.assert_array_equal(drawn_items, exp_items)
+
+    def test_call_zero_size(self):
+        choice = RandomChoice(self.items, self.p)
+        drawn_items = choice(RandomStateService(seed=1), 0)
+        self.assertEqual(drawn_items.shape, (0,))
+
+    def test_unnormalized_probabilities(self):
+        choice = RandomChoice(self.items, 3*self.p)
+        self.assertAlmostEqual(choice.cdf[-1], 1.)
+
+    def test_invalid_probabilities(self):
+        with self.assertRaises(ValueError):
+            RandomChoice(self.items, self.p[:-1])
+        with self.assertRaises(ValueError):
+            RandomChoice(self.items, -self.p)
+        with self.assertRaises(ValueError):
+            RandomChoice(self.items, np.zeros_like(self.p))
+
+
+class TestAliasRandomChoice(unittest.TestCase):
+    def setUp(self):
+        self.items = np.arange(100, 150)
+        self.p = np.random.RandomState(seed=0).uniform(size=len(self.items))
+        self.p[[3, 17]] = 0
+        self.p /= np.sum(self.p)
+
+    def test_call(self):
+        """Checks that the drawn items follow the given probabilities.
+        """
+        choice = AliasRandomChoice(self.items, self.p)
+
+        n_draws = 1000000
+        drawn_items = choice(RandomStateService(seed=1), n_draws)
+        self.assertEqual(drawn_items.shape, (n_draws,))
+
+        counts = np.bincount(
+            drawn_items - self.items[0], minlength=len(self.items))
+        exp_counts = n_draws * self.p
+
+        # Items with zero probability must never be drawn.
+        self.assertTrue(np.all(counts[exp_counts == 0] == 0))
+
+        m = exp_counts > 0
+        chi2 = np.sum((counts[m] - exp_counts[m])**2 / exp_counts[m])
+        self.assertLess(chi2, 2*np.count_nonzero(m))
+
+    def test_alias_table(self):
+        """Checks that the alias tables reproduce the probabilities.
+        """
+        choice = AliasRandomChoice(self.items, self.p)
+
+        n = len(self.items)
+        p = choice._prob_table / n
+        np.add.at(p, choice._alias_table, (1 - choice._prob_table) / n)
+
+        np.testing.assert_allclose(p, self.p, atol=1e-12)
+
+    @unittest.skipIf(not random.NUMBA_LOADED, 'numba is not available')
+    def test_alias_table_without_numba(self):
+        (prob_table, alias_table) = random._build_alias_table(self.p)
+        (exp_prob_table, exp_alias_table) = \
+            random._build_alias_table.py_func(self.p)
+
+        np.testing.assert_array_equal(prob_table, exp_prob_table)
+        np.testing.assert_array_equal(alias_table, exp_alias_table)
+
+    def test_invalid_probabilities(self):
+        with self.assertRaises(ValueError):
+            AliasRandomChoice(self.items, self.p[:-1])
+        with self.assertRaises(ValueError):
+            AliasRandomChoice(self.items, -self.p)
+        with self.assertRaises(ValueError):
+            AliasRandomChoice(self.items, np.zeros_like(self.p))
+
+
+if(__name__ == '__main__'):
+    unittest.main()
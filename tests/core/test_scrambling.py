@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import numpy as np
+
+from skyllh.core import scrambling
+from skyllh.core.random import RandomStateService
+from skyllh.core.scrambling import (
+    DataScrambler,
+    UniformRAScramblingMethod
+)
+from skyllh.core.storage import DataFieldRecordArray
+
+
+class RandomStateServiceStub(object):
+    def __init__(self, rng):
+        self.random = rng
+
+
+class TestUniformRAScramblingMethod(unittest.TestCase):
+    def setUp(self):
+        self.n_events = 1000
+        self.ra_range = (1, 2)
+
+    def _scramble(self, dtype):
+        data = DataFieldRecordArray({
+            'ra': np.zeros((self.n_events,), dtype=dtype),
+            'dec': np.zeros((self.n_events,), dtype=dtype)
+        })
+        scr = DataScrambler(
+            method=UniformRAScramblingMethod(ra_range=self.ra_range))
+        return scr.scramble_data(RandomStateService(seed=1), data)
+
+    def test_scramble(self):
+        data = self._scramble(np.float64)
+
+        rss = RandomStateService(seed=1)
+        ra = rss.random.uniform(*self.ra_range, size=self.n_events)
+
+        self.assertEqual(data['ra'].dtype, np.float64)
+        np.testing.assert_array_equal(data['ra'], ra)
+        np.testing.assert_array_equal(data['dec'], 0)
+
+    def test_scramble_float32(self):
+        data = self._scramble(np.float32)
+
+        rss = RandomStateService(seed=1)
+        ra = rss.random.uniform(
+            *self.ra_range, size=self.n_events).astype(np.float32)
+
+        self.assertEqual(data['ra'].dtype, np.float32)
+        np.testing.assert_array_equal(data['ra'], ra)
+
+    @unittest.skipIf(not scrambling.NUMBA_LOADED, 'numba is not available')
+    def test_scramble_without_numba(self):
+        data_numba = self._scramble(np.float64)
+
+        scrambling.NUMBA_LOADED = False
+        try:
+            data = self._scramble(np.float64)
+        finally:
+            scrambling.NUMBA_LOADED = True
+
+        np.testing.assert_array_equal(data['ra'], data_numba['ra'])
+
+    def _scramble_with_rng(self, rng):
+        data = DataFieldRecordArray({
+            'ra': np.zeros((self.n_events,), dtype=np.float64)
+        })
+        # RandomStateService accepts only RandomState instances, so use a
+        # stub providing the given random number generator.
+        rss = RandomStateServiceStub(rng)
+        scr = DataScrambler(
+            method=UniformRAScramblingMethod(ra_range=self.ra_range))
+        return scr.scramble_data(rss, data)
+
+    def test_scramble_without_bit_generator(self):
+        """Checks that the scrambling falls back to the uniform method of the
+        random number generator, if its bit generator is not accessible.
+        """
+        class RandomStateProxy(object):
+            def __init__(self, seed):
+                self._random = np.random.RandomState(seed)
+
+            def uniform(self, *args, **kwargs):
+                return self._random.uniform(*args, **kwargs)
+
+        data = self._scramble_with_rng(RandomStateProxy(1))
+
+        ra = np.random.RandomState(1).uniform(
+            *self.ra_range, size=self.n_events)
+        np.testing.assert_array_equal(data['ra'], ra)
+        np.testing.assert_array_equal(
+            data['ra'], self._scramble(np.float64)['ra'])
+
+    def test_scramble_with_generator(self):
+        """Checks that the public bit generator of a numpy.random.Generator
+        instance is used.
+        """
+        data = self._scramble_with_rng(np.random.default_rng(1))
+
+        ra = np.random.default_rng(1).uniform(
+            *self.ra_range, size=self.n_events)
+        np.testing.assert_allclose(data['ra'], ra, rtol=1e-15)
+
+
+if(__name__ == '__main__'):
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import numpy as np
+
+from skyllh.core import signalpdf
+from skyllh.core.config import CFG
+from skyllh.core.signalpdf import GaussianPSFPointLikeSourceSignalSpatialPDF
+
+
+class TrialDataManagerStub(object):
+    def __init__(self, data):
+        self._data = data
+
+    def get_data(self, name):
+        return self._data[name]
+
+
+class TestGaussianPSFPointLikeSourceSignalSpatialPDF(unittest.TestCase):
+    def setUp(self):
+        rss = np.random.RandomState(1)
+        n_events = 1000
+
+        src_array = np.empty((2,), dtype=[('ra', np.float64),
+                                          ('dec', np.float64)])
+        src_array['ra'] = [1.2, 4.]
+        src_array['dec'] = [0.3, -0.8]
+
+        self.tdm = TrialDataManagerStub({
+            'src_array': src_array,
+            'ra': rss.uniform(0, 2*np.pi, size=n_events),
+            'dec': rss.uniform(-np.pi/2, np.pi/2, size=n_events),
+            'ang_err': rss.uniform(0.005, 0.5, size=n_events)
+        })
+        self.pdf = GaussianPSFPointLikeSourceSignalSpatialPDF()
+
+    def test_get_prob(self):
+        (prob, grads) = self.pdf.get_prob(self.tdm)
+
+        ra = self.tdm.get_data('ra')
+        dec = self.tdm.get_data('dec')
+        sigma = self.tdm.get_data('ang_err')
+        (src_ra, src_dec) = (1.2, 0.3)
+        r = np.arccos(np.clip(
+            np.cos(src_ra - ra) * np.cos(src_dec) * np.cos(dec) +
+            np.sin(src_dec) * np.sin(dec), -1, 1))
+        exp_prob = 0.5/(np.pi*sigma**2) * np.exp(-0.5*(r / sigma)**2)
+
+        self.assertEqual(prob.shape, ra.shape)
+        self.assertEqual(grads.size, 0)
+        np.testing.assert_allclose(prob, exp_prob, rtol=1e-12)
+
+    @unittest.skipIf(not signalpdf.NUMBA_LOADED, 'numba is not available')
+    def test_get_prob_with_pdf_ufuncs(self):
+        (prob, grads) = self.pdf.get_prob(self.tdm)
+
+        # The ufunc gets created only on first use with enabled PDF ufuncs.
+        signalpdf._gaussian_psf_prob_ufunc = None
+        self.pdf.get_prob(self.tdm)
+        self.assertIsNone(signalpdf._gaussian_psf_prob_ufunc)
+
+        CFG['numba']['enable_pdf_ufuncs'] = True
+        try:
+            (prob_ufunc, grads_ufunc) = self.pdf.get_prob(self.tdm)
+        finally:
+            CFG['numba']['enable_pdf_ufuncs'] = False
+        self.assertIsNotNone(signalpdf._gaussian_psf_prob_ufunc)
+
+        self.assertEqual(prob_ufunc.shape, prob.shape)
+        self.assertEqual(grads_ufunc.size, 0)
+        np.testing.assert_allclose(prob_ufunc, prob, rtol=1e-12)
+
+
+if(__name__ == '__main__'):
+    unittest.main()
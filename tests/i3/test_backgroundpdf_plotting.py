@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import numpy as np
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from skyllh.core.binning import BinningDefinition
+from skyllh.core.source_hypothesis import SourceHypoGroupManager
+from skyllh.core.storage import DataFieldRecordArray
+from skyllh.core.trialdata import TrialDataManager
+from skyllh.i3.backgroundpdf import DataBackgroundI3SpatialPDF
+from skyllh.plotting.i3.backgroundpdf import BackgroundI3SpatialPDFPlotter
+
+
+class SinDecOverriddenBackgroundI3SpatialPDF(DataBackgroundI3SpatialPDF):
+    """Background PDF, which changes the PDF values via the
+    ``get_prob_from_sindec`` method only.
+    """
+    def get_prob_from_sindec(self, sin_dec):
+        return 2 * super(
+            SinDecOverriddenBackgroundI3SpatialPDF, self).get_prob_from_sindec(
+                sin_dec)
+
+
+class RAOverriddenBackgroundI3SpatialPDF(DataBackgroundI3SpatialPDF):
+    """Background PDF, which overrides the ``get_prob`` method and depends on
+    right-ascention.
+    """
+    def get_prob(self, tdm, fitparams=None, tl=None):
+        (prob, grads) = super(
+            RAOverriddenBackgroundI3SpatialPDF, self).get_prob(
+                tdm, fitparams, tl)
+        return (prob * (1 + tdm.get_data('ra')), grads)
+
+
+class TestBackgroundI3SpatialPDFPlotter(unittest.TestCase):
+    def setUp(self):
+        rss = np.random.RandomState(1)
+        self.data_exp = DataFieldRecordArray({
+            'dec': np.arcsin(rss.uniform(-1, 1, size=10000))
+        })
+        self.sin_dec_binning = BinningDefinition(
+            'sin_dec', np.linspace(-1, 1, 11))
+        self.n_ra = 4
+
+    def tearDown(self):
+        plt.close('all')
+
+    def _plot(self, pdf_cls):
+        pdf = pdf_cls(self.data_exp, self.sin_dec_binning)
+        plotter = BackgroundI3SpatialPDFPlotter(TrialDataManager(), pdf)
+        (fig, axes) = plt.subplots()
+        img = plotter.plot(SourceHypoGroupManager(), axes, n_ra=self.n_ra)
+        pdfprobs = img.get_array()
+
+        self.assertEqual(
+            pdfprobs.shape, (self.sin_dec_binning.nbins, self.n_ra))
+
+        return (pdf, pdfprobs)
+
+    def test_plot(self):
+        (pdf, pdfprobs) = self._plot(DataBackgroundI3SpatialPDF)
+
+        prob = pdf.get_prob_from_sindec(self.sin_dec_binning.bincenters)
+        for i in range(self.n_ra):
+            np.testing.assert_allclose(pdfprobs[:, i], prob, rtol=1e-10)
+
+    def test_plot_get_prob_from_sindec_overridden(self):
+        (pdf, pdfprobs) = self._plot(SinDecOverriddenBackgroundI3SpatialPDF)
+
+        prob = pdf.get_prob_from_sindec(self.sin_dec_binning.bincenters)
+        np.testing.assert_allclose(prob, 2*pdf.prob_at_bincenters, rtol=1e-10)
+        for i in range(self.n_ra):
+            np.testing.assert_allclose(pdfprobs[:, i], prob, rtol=1e-10)
+
+    def test_plot_get_prob_overridden(self):
+        (pdf, pdfprobs) = self._plot(RAOverriddenBackgroundI3SpatialPDF)
+
+        ra_axis = pdf.axes.get_axis('ra')
+        ra_binedges = np.linspace(ra_axis.vmin, ra_axis.vmax, self.n_ra+1)
+        ra_bincenters = 0.5*(ra_binedges[:-1] + ra_binedges[1:])
+        prob = pdf.get_prob_from_sindec(self.sin_dec_binning.bincenters)
+        np.testing.assert_allclose(
+            pdfprobs, prob[:, np.newaxis] * (1 + ra_bincenters), rtol=1e-10)
+
+
+if(__name__ == '__main__'):
+    unittest.main()
@@ -73,6 +73,114 @@ class TestSource(unittest.TestCase):
         np.testing.assert_array_equal(point_like_source_collection.ra, ra_array)
         np.testing.assert_array_equal(point_like_source_collection.dec, dec_array)
 
+    def test_PointLikeSourceCollection_add_pop(self):
+        point_like_source_collection = PointLikeSourceCollection()
+        for i in range(5):
+            point_like_source_collection.add(PointLikeSource(i, -i))
+
+        np.testing.assert_array_equal(
+            point_like_source_collection.ra, [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(
+            point_like_source_collection.dec, [0, -1, -2, -3, -4])
+
+        point_like_source_collection.pop(1)
+        point_like_source_collection.pop(-1)
+        point_like_source_collection.pop()
+
+        np.testing.assert_array_equal(
+            point_like_source_collection.ra, [0, 2])
+        np.testing.assert_array_equal(
+            point_like_source_collection.dec, [0, -2])
+
+    def test_PointLikeSourceCollection_from_arrays(self):
+        point_like_source_collection = PointLikeSourceCollection.from_arrays(
+            ra=[0, 1, 2], dec=[0, -1, -2])
+
+        self.assertEqual(len(point_like_source_collection), 3)
+        self.assertIsInstance(
+            point_like_source_collection.sources[2], PointLikeSource)
+        self.assertEqual(point_like_source_collection.sources[2].ra, 2)
+        self.assertEqual(point_like_source_collection.sources[2].dec, -2)
+        np.testing.assert_array_equal(
+            point_like_source_collection.ra, [0, 1, 2])
+        np.testing.assert_array_equal(
+            point_like_source_collection.dec, [0, -1, -2])
+
+        point_like_source_collection.add(PointLikeSource(3, -3))
+        np.testing.assert_array_equal(
+            point_like_source_collection.ra, [0, 1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            PointLikeSourceCollection.from_arrays(ra=[0, 1], dec=[0])
+
+    def test_PointLikeSourceCollection_read_only_locations(self):
+        point_like_source_collection = PointLikeSourceCollection(
+            sources=[PointLikeSource(0, 0), PointLikeSource(1, -1)])
+
+        with self.assertRaises(ValueError):
+            point_like_source_collection.ra[0] = 2
+        with self.assertRaises(ValueError):
+            point_like_source_collection.dec[0] = 2
+        np.testing.assert_array_equal(
+            point_like_source_collection.ra, [0, 1])
+
+    def test_PointLikeSourceCollection_copy_on_add(self):
+        """The location arrays hold the source locations at the time the
+        sources were added. Later changes of the source locations are not
+        reflected by the location arrays.
+        """
+        point_like_source = PointLikeSource(1, -1)
+        point_like_source_collection = PointLikeSourceCollection(
+            sources=[point_like_source])
+
+        point_like_source.loc = SourceLocation(2, -2)
+        point_like_source.loc.ra = 3
+
+        self.assertEqual(point_like_source_collection.sources[0].ra, 3)
+        np.testing.assert_array_equal(point_like_source_collection.ra, [1])
+        np.testing.assert_array_equal(point_like_source_collection.dec, [-1])
+
+    def test_PointLikeSourceCollection_objects(self):
+        """The sources of the collection cannot be changed without updating
+        the location arrays.
+        """
+        point_like_source = PointLikeSource(1, -1)
+        point_like_source_collection = PointLikeSourceCollection(
+            sources=[point_like_source])
+
+        self.assertEqual(
+            point_like_source_collection.objects, (point_like_source,))
+        self.assertEqual(
+            point_like_source_collection.sources, (point_like_source,))
+        with self.assertRaises(AttributeError):
+            point_like_source_collection.sources.append(
+                PointLikeSource(2, -2))
+        with self.assertRaises(TypeError):
+            point_like_source_collection.sources[0] = PointLikeSource(2, -2)
+        np.testing.assert_array_equal(point_like_source_collection.ra, [1])
+
+    def test_PointLikeSourceCollection_source_mutation(self):
+        """The location arrays are snapshots of the source locations at the
+        time the sources were added.
+        """
+        point_like_source = PointLikeSource(1, -1)
+        point_like_source_collection = PointLikeSourceCollection(
+            sources=[point_like_source])
+
+        point_like_source.loc.ra = 2
+        point_like_source.loc.dec = -2
+
+        self.assertEqual(point_like_source_collection.sources[0].ra, 2)
+        self.assertEqual(point_like_source_collection.sources[0].dec, -2)
+        np.testing.assert_array_equal(point_like_source_collection.ra, [1])
+        np.testing.assert_array_equal(point_like_source_collection.dec, [-1])
+
+        # Re-adding the source takes its current location.
+        point_like_source_collection.pop()
+        point_like_source_collection.add(point_like_source)
+        np.testing.assert_array_equal(point_like_source_collection.ra, [2])
+        np.testing.assert_array_equal(point_like_source_collection.dec, [-2])
+
     def test_PointLikeSourceCatalog(self):
         name = "Point like source catalog test"
         point_like_source1 = PointLikeSource(self.ra, self.dec)